@@ -0,0 +1,53 @@
+"""
+Locales that have a catalog in `sentry/locale`, so that importing
+`sentry.constants` doesn't have to list the directory.
+
+This file is generated by `bin/build-language-manifest`, do not edit it by hand.
+"""
+
+AVAILABLE_LANGUAGES = (
+    "ach",
+    "af",
+    "ar",
+    "bg",
+    "ca",
+    "cs",
+    "da",
+    "de",
+    "el",
+    "en",
+    "es",
+    "et",
+    "fa",
+    "fi",
+    "fr",
+    "gl",
+    "he",
+    "hi",
+    "hu",
+    "id",
+    "it",
+    "ja",
+    "ko",
+    "lt",
+    "lv",
+    "nl-nl",
+    "no",
+    "pl",
+    "pl-pl",
+    "pt",
+    "pt-br",
+    "ro",
+    "ro-ro",
+    "ru",
+    "ru-ru",
+    "sk",
+    "sl",
+    "sv-se",
+    "th",
+    "tr",
+    "uk",
+    "vi",
+    "zh-cn",
+    "zh-tw",
+)
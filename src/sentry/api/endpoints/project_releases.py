@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sentry_sdk
 from django.db import IntegrityError, router, transaction
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from rest_framework.request import Request
 from rest_framework.response import Response
 
@@ -12,18 +12,20 @@ from sentry.api.api_publish_status import ApiPublishStatus
 from sentry.api.base import region_silo_endpoint
 from sentry.api.bases.project import ProjectEndpoint, ProjectReleasePermission
 from sentry.api.helpers.environments import get_environment
-from sentry.api.paginator import OffsetPaginator
+from sentry.api.paginator import DateTimeIdPaginator
 from sentry.api.serializers import serialize
 from sentry.api.serializers.rest_framework import ReleaseWithVersionSerializer
 from sentry.api.utils import get_auth_api_token_type
 from sentry.models.activity import Activity
 from sentry.models.environment import Environment
-from sentry.models.orgauthtoken import is_org_auth_token_auth, update_org_auth_token_last_used
+from sentry.models.orgauthtoken import update_org_auth_token_last_used
 from sentry.models.release import Release, ReleaseStatus
-from sentry.plugins.interfaces.releasehook import ReleaseHook
+from sentry.models.releaseprojectenvironment import ReleaseProjectEnvironment
+from sentry.models.releases.release_project import ReleaseProject
 from sentry.ratelimits.config import SENTRY_RATELIMITER_GROUP_DEFAULTS, RateLimitConfig
 from sentry.signals import release_created
 from sentry.types.activity import ActivityType
+from sentry.utils.cursors import StringCursor
 from sentry.utils.sdk import bind_organization_context
 
 
@@ -64,19 +66,34 @@ class ProjectReleasesEndpoint(ProjectEndpoint):
                 organization_id=project.organization_id,
             ).filter(Q(status=ReleaseStatus.OPEN) | Q(status=None))
             if environment is not None:
+                # A semi-join can't duplicate releases and is served by the
+                # unique (project, release, environment) index.
                 queryset = queryset.filter(
-                    releaseprojectenvironment__project=project,
-                    releaseprojectenvironment__environment=environment,
+                    Exists(
+                        ReleaseProjectEnvironment.objects.filter(
+                            release=OuterRef("pk"), project=project, environment=environment
+                        )
+                    )
                 )
 
         if query:
             queryset = queryset.filter(version__icontains=query)
 
+        # Seek on the sort expression and id instead of using an OFFSET so that
+        # deep pages don't have to scan and discard every preceding row, and
+        # releases sharing a date keep a stable order. The columns are qualified
+        # because the paginator prefixes the table name onto any extra select
+        # without a "." when it builds the cursor predicate.
         return self.paginate(
             request=request,
-            queryset=queryset.extra(select={"sort": "COALESCE(date_released, date_added)"}),
+            queryset=queryset.extra(
+                select={
+                    "sort": "COALESCE(sentry_release.date_released, sentry_release.date_added)"
+                }
+            ),
             order_by="-sort",
-            paginator_cls=OffsetPaginator,
+            paginator_cls=DateTimeIdPaginator,
+            cursor_cls=StringCursor,
             on_results=lambda x: serialize(
                 x, request.user, project=project, environment=environment
             ),
@@ -126,6 +143,7 @@ class ProjectReleasesEndpoint(ProjectEndpoint):
             scope.set_tag("version", result["version"])
 
             new_status = result.get("status")
+            user_agent = request.META.get("HTTP_USER_AGENT", "")
 
             # release creation is idempotent to simplify user
             # experiences
@@ -133,44 +151,66 @@ class ProjectReleasesEndpoint(ProjectEndpoint):
             if owner := result.get("owner"):
                 owner_id = owner.id
 
-            try:
-                with transaction.atomic(router.db_for_write(Release)):
+            # Retries from the CLI usually hit an existing release, so look it up
+            # first rather than paying for a failed insert and a rollback.
+            release = Release.objects.filter(
+                organization_id=project.organization_id, version=result["version"]
+            ).first()
+            if release is not None:
+                created = False
+                was_released = bool(release.date_released)
+            else:
+                try:
+                    with transaction.atomic(router.db_for_write(Release)):
+                        release, created = (
+                            Release.objects.create(
+                                organization_id=project.organization_id,
+                                version=result["version"],
+                                ref=result.get("ref"),
+                                url=result.get("url"),
+                                owner_id=owner_id,
+                                date_released=result.get("dateReleased"),
+                                status=new_status or ReleaseStatus.OPEN,
+                                user_agent=user_agent,
+                            ),
+                            True,
+                        )
+                    was_released = False
+                except IntegrityError:
+                    # Lost a race with a concurrent request creating the same release.
                     release, created = (
-                        Release.objects.create(
-                            organization_id=project.organization_id,
-                            version=result["version"],
-                            ref=result.get("ref"),
-                            url=result.get("url"),
-                            owner_id=owner_id,
-                            date_released=result.get("dateReleased"),
-                            status=new_status or ReleaseStatus.OPEN,
-                            user_agent=request.META.get("HTTP_USER_AGENT", ""),
+                        Release.objects.get(
+                            organization_id=project.organization_id, version=result["version"]
                         ),
-                        True,
+                        False,
                     )
-                was_released = False
-            except IntegrityError:
-                release, created = (
-                    Release.objects.get(
-                        organization_id=project.organization_id, version=result["version"]
-                    ),
-                    False,
-                )
-                was_released = bool(release.date_released)
-            else:
-                release_created.send_robust(release=release, sender=self.__class__)
+                    was_released = bool(release.date_released)
+                else:
+                    release_created.send_robust(release=release, sender=self.__class__)
 
             if not created and new_status is not None and new_status != release.status:
                 release.status = new_status
-                release.save()
+                release.save(update_fields=["status"])
 
-            _, releaseproject_created = release.add_project(project)
+            # Re-uploads usually find the release already linked to the project,
+            # which a plain lookup can tell us without opening a savepoint. Only
+            # skip `add_project` once the project's `has_releases` flag is set,
+            # since it also repairs that flag.
+            if (
+                project.flags.has_releases
+                and ReleaseProject.objects.filter(release=release, project=project).exists()
+            ):
+                releaseproject_created = False
+            else:
+                _, releaseproject_created = release.add_project(project)
 
             commit_list = result.get("commits")
             if commit_list:
-                hook = ReleaseHook(project)
+                # The release already exists and is linked to the project, so
+                # set the commits directly rather than going through
+                # `ReleaseHook.set_commits`, which would try to create it again.
                 # TODO(dcramer): handle errors with release payloads
-                hook.set_commits(release.version, commit_list)
+                release.set_commits(commit_list)
 
             if not was_released and release.date_released:
                 Activity.objects.create(
@@ -190,18 +230,21 @@ class ProjectReleasesEndpoint(ProjectEndpoint):
             else:
                 status = 201
 
+            auth_type = get_auth_api_token_type(request.auth)
             analytics.record(
                 ReleaseCreatedEvent(
-                    user_id=request.user.id if request.user and request.user.id else None,
+                    user_id=getattr(request.user, "id", None) or None,
                     organization_id=project.organization_id,
                     project_ids=[project.id],
-                    user_agent=request.META.get("HTTP_USER_AGENT", "")[:256],
+                    user_agent=user_agent[:256],
                     created_status=status,
-                    auth_type=get_auth_api_token_type(request.auth),
+                    auth_type=auth_type,
                 )
             )
 
-            if is_org_auth_token_auth(request.auth):
+            # The last-used write is debounced per token and goes through a
+            # region outbox, so it doesn't block on the control silo.
+            if auth_type == "org_auth_token":
                 update_org_auth_token_last_used(request.auth, [project.id])
 
             scope.set_tag("success_status", status)
@@ -1,7 +1,9 @@
-from pathlib import PurePath, PureWindowsPath
+import functools
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
+from django.db.models import F, Value
+from django.db.models.lookups import StartsWith
 from rest_framework import serializers, status
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -20,6 +22,24 @@ from sentry.models.project import Project
 from sentry.models.repository import Repository
 
 
+def get_basename(path: str) -> str:
+    """
+    Returns the last component of a POSIX or Windows style path. This is all we
+    need to compare file names, and is much cheaper than building a PurePath.
+    """
+    path = path.rstrip("/\\")
+    return path[max(path.rfind("/"), path.rfind("\\")) + 1 :]
+
+
+@functools.cache
+def get_stacktrace_link_providers() -> tuple[str, ...]:
+    # The integration registry is populated at startup and doesn't change
+    # afterwards, so there's no need to rebuild this on every request.
+    return tuple(
+        x.key for x in integrations.all() if x.has_feature(IntegrationFeatures.STACKTRACE_LINK)
+    )
+
+
 class PathMappingSerializer(CamelSnakeSerializer[dict[str, str]]):
     stack_path = serializers.CharField()
     source_url = serializers.URLField()
@@ -27,63 +47,76 @@ class PathMappingSerializer(CamelSnakeSerializer[dict[str, str]]):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.integration: RpcIntegration | None = None
+        self.installation: RepositoryIntegration | None = None
         self.repo: Repository | None = None
 
     @property
     def providers(self) -> list[str]:
-        return [
-            x.key for x in integrations.all() if x.has_feature(IntegrationFeatures.STACKTRACE_LINK)
-        ]
+        return list(get_stacktrace_link_providers())
 
     @property
     def org_id(self) -> int:
         return self.context["organization_id"]
 
-    def validate_source_url(self, source_url: str) -> str:
-        # first check to see if we are even looking at the same file
-        stack_path = self.initial_data["stack_path"]
+    def validate(self, attrs: dict[str, str]) -> dict[str, str]:
+        source_url = attrs["source_url"]
 
-        stack_file = PureWindowsPath(stack_path).name
-        source_file = PurePath(urlparse(source_url).path).name
+        # first check to see if we are even looking at the same file
+        stack_file = get_basename(attrs["stack_path"])
+        source_file = get_basename(urlsplit(source_url).path)
 
         if stack_file != source_file:
             raise serializers.ValidationError(
-                "Source code URL points to a different file than the stack trace"
+                {"source_url": "Source code URL points to a different file than the stack trace"}
             )
 
-        def integration_match(integration: RpcIntegration) -> bool:
-            installation = integration.get_installation(self.org_id)
-            # Check if the installation has the source_url_matches method
-            if isinstance(installation, RepositoryIntegration):
-                return installation.source_url_matches(source_url)
-            # Fallback to a basic check if the method doesn't exist
-            return False
-
-        def repo_match(repo: Repository) -> bool:
-            return repo.url is not None and source_url.startswith(repo.url)
-
-        # now find the matching integration
-        integrations = integration_service.get_integrations(
-            organization_id=self.org_id, providers=self.providers
-        )
-
-        matching_integrations = list(filter(integration_match, integrations))
-        if not matching_integrations:
-            raise serializers.ValidationError("Could not find integration")
-
-        self.integration = matching_integrations[0]
+        # An integration may be checked both for a matching repo and again when
+        # picking the error to report, so only load each installation once.
+        installations: dict[int, RepositoryIntegration | None] = {}
+
+        def matching_installation(integration: RpcIntegration) -> RepositoryIntegration | None:
+            if integration.id not in installations:
+                installation = integration.get_installation(self.org_id)
+                # Check if the installation has the source_url_matches method
+                if isinstance(installation, RepositoryIntegration) and (
+                    installation.source_url_matches(source_url)
+                ):
+                    installations[integration.id] = installation
+                else:
+                    installations[integration.id] = None
+            return installations[integration.id]
+
+        integrations = {
+            integration.id: integration
+            for integration in integration_service.get_integrations(
+                organization_id=self.org_id, providers=self.providers
+            )
+        }
 
-        # now find the matching repo
+        # Let the database find the repos whose url is a prefix of the source
+        # url, so we only need to load an installation for their integrations.
         repos = Repository.objects.filter(
-            organization_id=self.org_id, integration_id=self.integration.id, url__isnull=False
-        )
-        matching_repos = list(filter(repo_match, repos))
-        if not matching_repos:
-            raise serializers.ValidationError("Could not find repo")
-
-        # store the repo we found
-        self.repo = matching_repos[0]
-        return source_url
+            StartsWith(Value(source_url), F("url")),
+            organization_id=self.org_id,
+            integration_id__in=list(integrations),
+            url__isnull=False,
+        ).order_by("id")
+        for repo in repos:
+            integration = integrations[repo.integration_id]
+            installation = matching_installation(integration)
+            if installation is not None:
+                self.integration = integration
+                self.installation = installation
+                self.repo = repo
+                return attrs
+
+        # Only work out which error to report once we know nothing matched.
+        if not any(
+            matching_installation(integration) is not None
+            for integration in integrations.values()
+        ):
+            raise serializers.ValidationError({"source_url": "Could not find integration"})
+        raise serializers.ValidationError({"source_url": "Could not find repo"})
 
 
 class ProjectRepoPathParsingEndpointLoosePermission(ProjectPermission):
@@ -124,18 +157,14 @@ class ProjectRepoPathParsingEndpoint(ProjectEndpoint):
         # validated by `serializer.is_valid()`
         assert serializer.repo is not None
         assert serializer.integration is not None
+        assert serializer.installation is not None
         repo = serializer.repo
         integration = serializer.integration
-        installation = integration.get_installation(project.organization_id)
-
-        if not isinstance(installation, RepositoryIntegration):
-            return self.respond(
-                {"detail": "Integration does not support repository operations"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        installation = serializer.installation
 
-        branch = installation.extract_branch_from_source_url(repo, source_url)
-        source_path = installation.extract_source_path_from_source_url(repo, source_url)
+        branch, source_path = installation.extract_branch_and_source_path_from_source_url(
+            repo, source_url
+        )
         stack_root, source_root = find_roots(frame_info, source_path)
 
         return self.respond(
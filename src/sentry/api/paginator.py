@@ -3,7 +3,7 @@ import functools
 import logging
 import math
 from collections.abc import Callable, Iterable, Sequence
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Protocol
 from urllib.parse import quote
 
@@ -237,6 +237,54 @@ class DateTimePaginator(BasePaginator):
         )
 
 
+class DateTimeIdPaginator(BasePaginator):
+    """
+    Seeks on a datetime key with the row id as a tiebreaker, so rows that share
+    a timestamp keep a stable order across pages. The cursor value holds the
+    full microsecond timestamp and the id, which requires a `StringCursor`.
+    """
+
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    # Zero padded so that keys compare the same way as strings as they do as
+    # (timestamp, id) pairs.
+    key_format = "{:020d}.{:020d}"
+
+    def build_queryset(self, value, is_prev):
+        asc = self._is_asc(is_prev)
+        direction = "" if asc else "-"
+        queryset = self.queryset.order_by(f"{direction}{self.key}", f"{direction}id")
+
+        if value:
+            if self.key in queryset.query.extra:
+                col_query, col_params = queryset.query.extra[self.key]
+                col_params = col_params[:]
+            else:
+                col_query, col_params = quote_name(self.key), []
+            table = queryset.model._meta.db_table
+            col = col_query if "." in col_query else f"{table}.{col_query}"
+            operator = ">=" if asc else "<="
+            queryset = queryset.extra(
+                where=[f"({col}, {table}.id) {operator} (%s, %s)"],
+                params=[*col_params, *value],
+            )
+
+        return queryset
+
+    def get_item_key(self, item, for_prev=False):
+        micros = (getattr(item, self.key) - self.epoch) // timedelta(microseconds=1)
+        return self.key_format.format(micros, item.id)
+
+    def value_from_cursor(self, cursor):
+        # An empty result set hands out a "0" cursor, which starts from the top.
+        if str(cursor.value) == "0":
+            return None
+        micros, _, item_id = str(cursor.value).partition(".")
+        try:
+            return self.epoch + timedelta(microseconds=int(micros)), int(item_id)
+        except ValueError:
+            raise BadPaginationError("Invalid cursor value")
+
+
 # TODO(dcramer): previous cursors are too complex at the moment for many things
 # and are only useful for polling situations. The OffsetPaginator ignores them
 # entirely and uses standard paging
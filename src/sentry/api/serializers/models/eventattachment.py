@@ -1,3 +1,4 @@
+import functools
 import mimetypes
 
 from sentry.api.serializers import Serializer, register
@@ -7,11 +8,12 @@ from sentry.models.files.file import File
 
 @register(EventAttachment)
 class EventAttachmentSerializer(Serializer):
+    # `get_attrs` is intentionally not overridden: attachments need no related
+    # data, and the base implementation returns an empty mapping without
+    # touching `item_list`.
+
     def serialize(self, obj, attrs, user, **kwargs):
         content_type = obj.content_type
-        size = obj.size or 0
-        sha1 = obj.sha1
-        headers = {"Content-Type": content_type}
 
         return {
             "id": str(obj.id),
@@ -20,16 +22,24 @@ class EventAttachmentSerializer(Serializer):
             "name": obj.name,
             "mimetype": content_type,
             "dateCreated": obj.date_added,
-            "size": size,
+            "size": obj.size or 0,
             # TODO: It would be nice to deprecate these two fields.
             # If not, we can at least define `headers` as `Content-Type: $mimetype`.
-            "headers": headers,
-            "sha1": sha1,
+            "headers": {"Content-Type": content_type},
+            "sha1": obj.sha1,
         }
 
 
+@functools.lru_cache(maxsize=1024)
+def _guess_mimetype(suffixes: str) -> str:
+    return mimetypes.guess_type(f"file{suffixes}")[0] or "application/octet-stream"
+
+
 def get_mimetype(file: File) -> str:
     rv = file.headers.get("Content-Type")
     if rv:
         return rv.split(";")[0].strip()
-    return mimetypes.guess_type(file.name)[0] or "application/octet-stream"
+    # `guess_type` only looks at the extensions (e.g. `.tar.gz`), so key the
+    # cache on those rather than on the full, mostly unique, file name.
+    _, dot, suffixes = file.name.rpartition("/")[2].partition(".")
+    return _guess_mimetype(dot + suffixes)
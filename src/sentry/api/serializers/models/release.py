@@ -341,18 +341,20 @@ class ReleaseSerializer(Serializer):
         )
 
     def __get_release_data_no_environment(self, project, item_list, no_snuba_for_release_creation):
-        if project is not None:
-            project_ids = [project.id]
-            organization_id = project.organization_id
-        else:
-            project_ids = self.__get_project_id_list(item_list)
-            organization_id = item_list[0].organization_id
-
         first_seen: dict[str, datetime.datetime] = {}
         last_seen: dict[str, datetime.datetime] = {}
         if no_snuba_for_release_creation:
+            # The project ids are only needed for the tagstore lookup, so don't
+            # query for them when it is skipped.
             tag_values = []
         else:
+            if project is not None:
+                project_ids = [project.id]
+                organization_id = project.organization_id
+            else:
+                project_ids = self.__get_project_id_list(item_list)
+                organization_id = item_list[0].organization_id
+
             tag_values = tagstore.backend.get_release_tags(
                 organization_id,
                 project_ids,
@@ -414,13 +416,15 @@ class ReleaseSerializer(Serializer):
 
         return first_seen, last_seen, group_counts_by_release
 
-    def _get_release_project_envs(self, item_list, environments, project):
+    def _get_release_project_envs(self, item_list, environments, project, environment_ids=None):
         release_project_envs = (
             ReleaseProjectEnvironment.objects.filter(release__in=item_list)
             .select_related("release", "project")
             .order_by("-first_seen")
         )
-        if environments is not None:
+        if environment_ids is not None:
+            release_project_envs = release_project_envs.filter(environment_id__in=environment_ids)
+        elif environments is not None:
             release_project_envs = release_project_envs.filter(environment__name__in=environments)
         if project is not None:
             release_project_envs = release_project_envs.filter(project=project)
@@ -434,9 +438,13 @@ class ReleaseSerializer(Serializer):
         # environment names.
         environment = kwargs.get("environment")
         environments = kwargs.get("environments")
+        environment_ids = None
         if not environments:
             if environment:
                 environments = [environment.name]
+                # We already have the environment row, so filter on its id
+                # rather than joining against sentry_environment by name.
+                environment_ids = [environment.id]
             else:
                 environments = None
 
@@ -452,7 +460,9 @@ class ReleaseSerializer(Serializer):
         adoption_stages = {}
         release_project_envs = None
         if self.with_adoption_stages:
-            release_project_envs = self._get_release_project_envs(item_list, environments, project)
+            release_project_envs = self._get_release_project_envs(
+                item_list, environments, project, environment_ids
+            )
             adoption_stages = self._get_release_adoption_stages(release_project_envs)
 
         if environments is None:
@@ -462,7 +472,7 @@ class ReleaseSerializer(Serializer):
         else:
             if release_project_envs is None:
                 release_project_envs = self._get_release_project_envs(
-                    item_list, environments, project
+                    item_list, environments, project, environment_ids
                 )
             (
                 first_seen,
@@ -3,28 +3,31 @@ These settings act as the default (base) settings for the Sentry-provided
 web-server
 """
 
+import functools
 import logging
 import os.path
-from collections import namedtuple
-from collections.abc import Sequence
+import re
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import timedelta
 from enum import Enum
-from typing import cast
+from types import MappingProxyType
+from typing import Any, NamedTuple, cast
 
 import sentry_relay.consts
 import sentry_relay.processing
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
+from sentry._language_manifest import AVAILABLE_LANGUAGES
 from sentry.seer.autofix.constants import AutofixAutomationTuningSettings
-from sentry.utils.geo import rust_geoip
 from sentry.utils.integrationdocs import load_doc
 
 
 def get_all_languages() -> list[str]:
     results = []
-    for path in os.listdir(os.path.join(MODULE_ROOT, "locale")):
-        if path.startswith("."):
+    locale_root = os.path.join(MODULE_ROOT, "locale")
+    for path in os.listdir(locale_root):
+        if path.startswith(".") or not os.path.isdir(os.path.join(locale_root, path)):
             continue
         if "_" in path:
             pre, post = path.split("_", 1)
@@ -235,17 +238,19 @@ RESERVED_PROJECT_SLUGS = frozenset(
     )
 )
 
-LOG_LEVELS = {
-    logging.NOTSET: "sample",
-    logging.DEBUG: "debug",
-    logging.INFO: "info",
-    logging.WARNING: "warning",
-    logging.ERROR: "error",
-    logging.FATAL: "fatal",
-}
+LOG_LEVELS: Mapping[int, str] = MappingProxyType(
+    {
+        logging.NOTSET: "sample",
+        logging.DEBUG: "debug",
+        logging.INFO: "info",
+        logging.WARNING: "warning",
+        logging.ERROR: "error",
+        logging.FATAL: "fatal",
+    }
+)
 DEFAULT_LOG_LEVEL = "error"
 DEFAULT_LOGGER_NAME = ""
-LOG_LEVELS_MAP = {v: k for k, v in LOG_LEVELS.items()}
+LOG_LEVELS_MAP: Mapping[str, int] = MappingProxyType({v: k for k, v in LOG_LEVELS.items()})
 
 PLACEHOLDER_EVENT_TITLES = frozenset(["<untitled>", "<unknown>", "<unlabeled event>", "Error"])
 
@@ -256,21 +261,25 @@ DEFAULT_ALERT_GROUP_THRESHOLD = (1000, 25)  # 1000%, 25 events
 # Default sort option for the group stream
 DEFAULT_SORT_OPTION = "date"
 
-# Setup languages for only available locales
-_language_map = dict(settings.LANGUAGES)
-LANGUAGES = [(k, _language_map[k]) for k in get_all_languages() if k in _language_map]
-del _language_map
+# Setup languages for only available locales. The locales on disk are read from
+# a manifest generated by `bin/build-language-manifest` rather than listing the
+# locale directory on every import.
+_available_languages = frozenset(AVAILABLE_LANGUAGES)
+LANGUAGES = [(k, v) for k, v in settings.LANGUAGES if k in _available_languages]
+del _available_languages
 
 # TODO(dcramer): We eventually want to make this user-editable
-TAG_LABELS = {
-    "exc_type": "Exception Type",
-    "sentry:user": "User",
-    "sentry:release": "Release",
-    "sentry:dist": "Distribution",
-    "os": "OS",
-    "url": "URL",
-    "server_name": "Server",
-}
+TAG_LABELS: Mapping[str, str] = MappingProxyType(
+    {
+        "exc_type": "Exception Type",
+        "sentry:user": "User",
+        "sentry:release": "Release",
+        "sentry:dist": "Distribution",
+        "os": "OS",
+        "url": "URL",
+        "server_name": "Server",
+    }
+)
 
 PROTECTED_TAG_KEYS = frozenset(["environment", "release", "sentry:release"])
 
@@ -346,20 +355,22 @@ WARN_SESSION_EXPIRED = _("Your session has expired.")
 MAX_SYM = 256
 
 # Known debug information file mimetypes
-KNOWN_DIF_FORMATS: dict[str, str] = {
-    "text/x-breakpad": "breakpad",
-    "application/x-mach-binary": "macho",
-    "application/x-elf-binary": "elf",
-    "application/x-dosexec": "pe",
-    "application/x-ms-pdb": "pdb",
-    "application/wasm": "wasm",
-    "text/x-proguard+plain": "proguard",
-    "application/x-sentry-bundle+zip": "sourcebundle",
-    "application/x-bcsymbolmap": "bcsymbolmap",
-    "application/x-debugid-map": "uuidmap",
-    "application/x-il2cpp-json": "il2cpp",
-    "application/x-portable-pdb": "portablepdb",
-}
+KNOWN_DIF_FORMATS: Mapping[str, str] = MappingProxyType(
+    {
+        "text/x-breakpad": "breakpad",
+        "application/x-mach-binary": "macho",
+        "application/x-elf-binary": "elf",
+        "application/x-dosexec": "pe",
+        "application/x-ms-pdb": "pdb",
+        "application/wasm": "wasm",
+        "text/x-proguard+plain": "proguard",
+        "application/x-sentry-bundle+zip": "sourcebundle",
+        "application/x-bcsymbolmap": "bcsymbolmap",
+        "application/x-debugid-map": "uuidmap",
+        "application/x-il2cpp-json": "il2cpp",
+        "application/x-portable-pdb": "portablepdb",
+    }
+)
 
 NATIVE_UNKNOWN_STRING = "<unknown>"
 
@@ -377,61 +388,80 @@ MAX_ARTIFACT_BUNDLE_FILES_OFFSET = MAX_RELEASE_FILES_OFFSET
 #                           "link": "https://docs.sentry.io/clients/java/integrations/#logback",
 #                           "id": "java-logback",
 #                           "name": "Logback"}
-INTEGRATION_ID_TO_PLATFORM_DATA: dict[str, dict[str, str]] = {}
+# Most importers never need this, so it is only loaded from _platforms.json on
+# first access (see `__getattr__`).
+INTEGRATION_ID_TO_PLATFORM_DATA: dict[str, dict[str, str]]
+
+_platform_data_cache: dict[str, dict[str, str]] | None = None
 
 
-def _load_platform_data() -> None:
-    INTEGRATION_ID_TO_PLATFORM_DATA.clear()
+def _load_platform_data() -> dict[str, dict[str, str]]:
     data = load_doc("_platforms")
 
     if not data:
-        return
-
-    for platform in data["platforms"]:
-        integrations = platform.pop("integrations")
-        if integrations:
-            for integration in integrations:
-                integration_id = integration.pop("id")
-                if integration["type"] != "language":
-                    integration["language"] = platform["id"]
-                INTEGRATION_ID_TO_PLATFORM_DATA[integration_id] = integration
-
-
-_load_platform_data()
+        return {}
+
+    return {
+        integration["id"]: {
+            **{key: value for key, value in integration.items() if key != "id"},
+            **({"language": platform["id"]} if integration["type"] != "language" else {}),
+        }
+        for platform in data["platforms"]
+        for integration in platform["integrations"] or ()
+    }
+
+
+def _get_platform_data() -> dict[str, dict[str, str]]:
+    global _platform_data_cache
+    if _platform_data_cache is None:
+        _platform_data_cache = _load_platform_data()
+    return _platform_data_cache
+
+
+def __getattr__(name: str) -> Any:
+    if name == "INTEGRATION_ID_TO_PLATFORM_DATA":
+        # Bind it on the module so later lookups don't come through here.
+        value = globals()[name] = _get_platform_data()
+        return value
+    if name == "DEFAULT_STORE_NORMALIZER_ARGS":
+        return get_default_store_normalizer_args()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # special cases where the marketing slug differs from the integration id
 # (in _platforms.json). missing values (for example: "java") should assume
 # the marketing slug is the same as the integration id:
 # javascript, node, python, php, ruby, go, swift, objc, java, perl, elixir
-MARKETING_SLUG_TO_INTEGRATION_ID = {
-    "kotlin": "java",
-    "scala": "java",
-    "spring": "java",
-    "android": "java-android",
-    "react": "javascript-react",
-    "angular": "javascript-angular",
-    "angular2": "javascript-angular2",
-    "ember": "javascript-ember",
-    "backbone": "javascript-backbone",
-    "vue": "javascript-vue",
-    "express": "node-express",
-    "koa": "node-koa",
-    "django": "python-django",
-    "flask": "python-flask",
-    "sanic": "python-sanic",
-    "tornado": "python-tornado",
-    "celery": "python-celery",
-    "rq": "python-rq",
-    "bottle": "python-bottle",
-    "pythonawslambda": "python-awslambda",
-    "pyramid": "python-pyramid",
-    "pylons": "python-pylons",
-    "laravel": "php-laravel",
-    "symfony": "php-symfony",
-    "rails": "ruby-rails",
-    "sinatra": "ruby-sinatra",
-    "dotnet": "csharp",
-}
+MARKETING_SLUG_TO_INTEGRATION_ID: Mapping[str, str] = MappingProxyType(
+    {
+        "kotlin": "java",
+        "scala": "java",
+        "spring": "java",
+        "android": "java-android",
+        "react": "javascript-react",
+        "angular": "javascript-angular",
+        "angular2": "javascript-angular2",
+        "ember": "javascript-ember",
+        "backbone": "javascript-backbone",
+        "vue": "javascript-vue",
+        "express": "node-express",
+        "koa": "node-koa",
+        "django": "python-django",
+        "flask": "python-flask",
+        "sanic": "python-sanic",
+        "tornado": "python-tornado",
+        "celery": "python-celery",
+        "rq": "python-rq",
+        "bottle": "python-bottle",
+        "pythonawslambda": "python-awslambda",
+        "pyramid": "python-pyramid",
+        "pylons": "python-pylons",
+        "laravel": "php-laravel",
+        "symfony": "php-symfony",
+        "rails": "ruby-rails",
+        "sinatra": "ruby-sinatra",
+        "dotnet": "csharp",
+    }
+)
 
 
 # to go from a marketing page slug like /for/android/ to the integration id
@@ -440,7 +470,7 @@ def get_integration_id_for_marketing_slug(slug: str) -> str | None:
     if slug in MARKETING_SLUG_TO_INTEGRATION_ID:
         return MARKETING_SLUG_TO_INTEGRATION_ID[slug]
 
-    if slug in INTEGRATION_ID_TO_PLATFORM_DATA:
+    if slug in _get_platform_data():
         return slug
 
     return None
@@ -449,9 +479,20 @@ def get_integration_id_for_marketing_slug(slug: str) -> str | None:
 # special cases where the integration sent with the SDK differ from
 # the integration id (in _platforms.json)
 # {PLATFORM: {INTEGRATION_SENT: integration_id, ...}, ...}
-PLATFORM_INTEGRATION_TO_INTEGRATION_ID = {
-    "java": {"java.util.logging": "java-logging"},
-    # TODO: add more special cases...
+PLATFORM_INTEGRATION_TO_INTEGRATION_ID: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        "java": {"java.util.logging": "java-logging"},
+        # TODO: add more special cases...
+    }
+)
+
+_SDK_NAME_PREFIX_RE = re.compile(r"sentry-|raven-")
+
+# flattened so that checking an event's integrations is a single lookup
+_PLATFORM_INTEGRATION_TO_INTEGRATION_ID = {
+    (platform, integration): integration_id
+    for platform, integrations in PLATFORM_INTEGRATION_TO_INTEGRATION_ID.items()
+    for integration, integration_id in integrations.items()
 }
 
 
@@ -463,27 +504,26 @@ PLATFORM_INTEGRATION_TO_INTEGRATION_ID = {
 def get_integration_id_for_event(
     platform: str, sdk_name: str, integrations: list[str]
 ) -> str | None:
+    platform_data = _get_platform_data()
     if integrations:
         for integration in integrations:
             # check special cases
-            if (
-                platform in PLATFORM_INTEGRATION_TO_INTEGRATION_ID
-                and integration in PLATFORM_INTEGRATION_TO_INTEGRATION_ID[platform]
-            ):
-                return PLATFORM_INTEGRATION_TO_INTEGRATION_ID[platform][integration]
+            special_case = _PLATFORM_INTEGRATION_TO_INTEGRATION_ID.get((platform, integration))
+            if special_case is not None:
+                return special_case
 
             # try <platform>-<integration>, for example "java-log4j"
             integration_id = f"{platform}-{integration}"
-            if integration_id in INTEGRATION_ID_TO_PLATFORM_DATA:
+            if integration_id in platform_data:
                 return integration_id
 
     # try sdk name, for example "sentry-java" -> "java" or "raven-java:log4j" -> "java-log4j"
-    sdk_name = sdk_name.lower().replace("sentry-", "").replace("raven-", "").replace(":", "-")
-    if sdk_name in INTEGRATION_ID_TO_PLATFORM_DATA:
+    sdk_name = _SDK_NAME_PREFIX_RE.sub("", sdk_name.lower()).replace(":", "-")
+    if sdk_name in platform_data:
         return sdk_name
 
     # try platform name, for example "java"
-    if platform in INTEGRATION_ID_TO_PLATFORM_DATA:
+    if platform in platform_data:
         return platform
 
     return None
@@ -497,14 +537,16 @@ class ObjectStatus:
 
     DISABLED = 1
 
+    _CHOICES = (
+        (ACTIVE, "active"),
+        (DISABLED, "disabled"),
+        (PENDING_DELETION, "pending_deletion"),
+        (DELETION_IN_PROGRESS, "deletion_in_progress"),
+    )
+
     @classmethod
     def as_choices(cls) -> Sequence[tuple[int, str]]:
-        return (
-            (cls.ACTIVE, "active"),
-            (cls.DISABLED, "disabled"),
-            (cls.PENDING_DELETION, "pending_deletion"),
-            (cls.DELETION_IN_PROGRESS, "deletion_in_progress"),
-        )
+        return cls._CHOICES
 
 
 class SentryAppStatus:
@@ -519,44 +561,32 @@ class SentryAppStatus:
     PUBLISH_REQUEST_INPROGRESS_STR = "publish_request_inprogress"
     DELETION_IN_PROGRESS_STR = "deletion_in_progress"
 
+    _CHOICES = (
+        (UNPUBLISHED, UNPUBLISHED_STR),
+        (PUBLISHED, PUBLISHED_STR),
+        (INTERNAL, INTERNAL_STR),
+        (PUBLISH_REQUEST_INPROGRESS, PUBLISH_REQUEST_INPROGRESS_STR),
+        (DELETION_IN_PROGRESS, DELETION_IN_PROGRESS_STR),
+    )
+    _INT_TO_STR = dict(_CHOICES)
+    _STR_TO_INT = {string: integer for integer, string in _CHOICES}
+
     @classmethod
     def as_choices(cls) -> Sequence[tuple[int, str]]:
-        return (
-            (cls.UNPUBLISHED, cls.UNPUBLISHED_STR),
-            (cls.PUBLISHED, cls.PUBLISHED_STR),
-            (cls.INTERNAL, cls.INTERNAL_STR),
-            (cls.PUBLISH_REQUEST_INPROGRESS, cls.PUBLISH_REQUEST_INPROGRESS_STR),
-            (cls.DELETION_IN_PROGRESS, cls.DELETION_IN_PROGRESS_STR),
-        )
+        return cls._CHOICES
 
     @classmethod
     def as_str(cls, status: int) -> str:
-        if status == cls.UNPUBLISHED:
-            return cls.UNPUBLISHED_STR
-        elif status == cls.PUBLISHED:
-            return cls.PUBLISHED_STR
-        elif status == cls.INTERNAL:
-            return cls.INTERNAL_STR
-        elif status == cls.PUBLISH_REQUEST_INPROGRESS:
-            return cls.PUBLISH_REQUEST_INPROGRESS_STR
-        elif status == cls.DELETION_IN_PROGRESS:
-            return cls.DELETION_IN_PROGRESS_STR
-        else:
+        try:
+            return cls._INT_TO_STR[status]
+        except KeyError:
             raise ValueError(f"Not a SentryAppStatus int: {status!r}")
 
     @classmethod
     def as_int(cls, status: str) -> int:
-        if status == cls.UNPUBLISHED_STR:
-            return cls.UNPUBLISHED
-        elif status == cls.PUBLISHED_STR:
-            return cls.PUBLISHED
-        elif status == cls.INTERNAL_STR:
-            return cls.INTERNAL
-        elif status == cls.PUBLISH_REQUEST_INPROGRESS_STR:
-            return cls.PUBLISH_REQUEST_INPROGRESS
-        elif status == cls.DELETION_IN_PROGRESS_STR:
-            return cls.DELETION_IN_PROGRESS
-        else:
+        try:
+            return cls._STR_TO_INT[status]
+        except KeyError:
             raise ValueError(f"Not a SentryAppStatus str: {status!r}")
 
     @classmethod
@@ -576,20 +606,21 @@ class SentryAppInstallationStatus:
     PENDING_STR = "pending"
     INSTALLED_STR = "installed"
 
+    _CHOICES = (
+        (PENDING, PENDING_STR),
+        (INSTALLED, INSTALLED_STR),
+    )
+    _INT_TO_STR = dict(_CHOICES)
+
     @classmethod
     def as_choices(cls) -> Sequence[tuple[int, str]]:
-        return (
-            (cls.PENDING, cls.PENDING_STR),
-            (cls.INSTALLED, cls.INSTALLED_STR),
-        )
+        return cls._CHOICES
 
     @classmethod
     def as_str(cls, status: int) -> str:
-        if status == cls.PENDING:
-            return cls.PENDING_STR
-        elif status == cls.INSTALLED:
-            return cls.INSTALLED_STR
-        else:
+        try:
+            return cls._INT_TO_STR[status]
+        except KeyError:
             raise ValueError(f"Not a SentryAppInstallationStatus int: {status!r}")
 
 
@@ -599,33 +630,34 @@ class ExportQueryType:
     ISSUES_BY_TAG_STR = "Issues-by-Tag"
     DISCOVER_STR = "Discover"
 
+    _CHOICES = ((ISSUES_BY_TAG, ISSUES_BY_TAG_STR), (DISCOVER, DISCOVER_STR))
+    _STR_CHOICES = (
+        (ISSUES_BY_TAG_STR, ISSUES_BY_TAG_STR),
+        (DISCOVER_STR, DISCOVER_STR),
+    )
+    _INT_TO_STR = dict(_CHOICES)
+    _STR_TO_INT = {string: integer for integer, string in _CHOICES}
+
     @classmethod
     def as_choices(cls) -> Sequence[tuple[int, str]]:
-        return ((cls.ISSUES_BY_TAG, cls.ISSUES_BY_TAG_STR), (cls.DISCOVER, cls.DISCOVER_STR))
+        return cls._CHOICES
 
     @classmethod
     def as_str_choices(cls) -> Sequence[tuple[str, str]]:
-        return (
-            (cls.ISSUES_BY_TAG_STR, cls.ISSUES_BY_TAG_STR),
-            (cls.DISCOVER_STR, cls.DISCOVER_STR),
-        )
+        return cls._STR_CHOICES
 
     @classmethod
     def as_str(cls, integer: int) -> str:
-        if integer == cls.ISSUES_BY_TAG:
-            return cls.ISSUES_BY_TAG_STR
-        elif integer == cls.DISCOVER:
-            return cls.DISCOVER_STR
-        else:
+        try:
+            return cls._INT_TO_STR[integer]
+        except KeyError:
             raise ValueError(f"Not an ExportQueryType int: {integer!r}")
 
     @classmethod
     def from_str(cls, string: str) -> int:
-        if string == cls.ISSUES_BY_TAG_STR:
-            return cls.ISSUES_BY_TAG
-        elif string == cls.DISCOVER_STR:
-            return cls.DISCOVER
-        else:
+        try:
+            return cls._STR_TO_INT[string]
+        except KeyError:
             raise ValueError(f"Not an ExportQueryType str: {string!r}")
 
 
@@ -643,44 +675,55 @@ class InsightModules(Enum):
     MCP = "mcp"
 
 
-INSIGHT_MODULE_FILTERS = {
-    InsightModules.HTTP: lambda spans: any(
-        span.get("sentry_tags", {}).get("category") == "http" and span.get("op") == "http.client"
-        for span in spans
-    ),
-    InsightModules.DB: lambda spans: any(
-        span.get("sentry_tags", {}).get("category") == "db" and "description" in span.keys()
-        for span in spans
-    ),
-    InsightModules.ASSETS: lambda spans: any(
-        span.get("op") in ["resource.script", "resource.css", "resource.font", "resource.img"]
-        for span in spans
-    ),
-    InsightModules.APP_START: lambda spans: any(
-        span.get("op").startswith("app.start.") for span in spans
-    ),
-    InsightModules.SCREEN_LOAD: lambda spans: any(
-        span.get("sentry_tags", {}).get("transaction.op") == "ui.load" for span in spans
-    ),
-    InsightModules.VITAL: lambda spans: any(
-        span.get("sentry_tags", {}).get("transaction.op") == "pageload" for span in spans
-    ),
-    InsightModules.CACHE: lambda spans: any(
-        span.get("op") in ["cache.get_item", "cache.get", "cache.put"] for span in spans
-    ),
-    InsightModules.QUEUE: lambda spans: any(
-        span.get("op") in ["queue.process", "queue.publish"] for span in spans
-    ),
-    InsightModules.LLM_MONITORING: lambda spans: any(
-        span.get("op").startswith("ai.pipeline") for span in spans
-    ),
-    InsightModules.AGENTS: lambda spans: any(
-        span.get("op").startswith("gen_ai.") for span in spans
-    ),
-    InsightModules.MCP: lambda spans: any(span.get("op").startswith("mcp.") for span in spans),
-}
+_ASSET_OPS = frozenset(["resource.script", "resource.css", "resource.font", "resource.img"])
+_CACHE_OPS = frozenset(["cache.get_item", "cache.get", "cache.put"])
+_QUEUE_OPS = frozenset(["queue.process", "queue.publish"])
+
+
+def detect_insight_modules(spans: Iterable[Mapping[str, Any]]) -> set[InsightModules]:
+    """
+    Returns the insight modules that any of the given spans belong to, checking
+    every module in a single pass over the spans.
+    """
+    modules: set[InsightModules] = set()
+    for span in spans:
+        op = span.get("op") or ""
+        sentry_tags = span.get("sentry_tags") or {}
+        category = sentry_tags.get("category")
+        transaction_op = sentry_tags.get("transaction.op")
+
+        if category == "http" and op == "http.client":
+            modules.add(InsightModules.HTTP)
+        if category == "db" and "description" in span:
+            modules.add(InsightModules.DB)
+        if op in _ASSET_OPS:
+            modules.add(InsightModules.ASSETS)
+        if op.startswith("app.start."):
+            modules.add(InsightModules.APP_START)
+        if transaction_op == "ui.load":
+            modules.add(InsightModules.SCREEN_LOAD)
+        if transaction_op == "pageload":
+            modules.add(InsightModules.VITAL)
+        if op in _CACHE_OPS:
+            modules.add(InsightModules.CACHE)
+        if op in _QUEUE_OPS:
+            modules.add(InsightModules.QUEUE)
+        if op.startswith("ai.pipeline"):
+            modules.add(InsightModules.LLM_MONITORING)
+        if op.startswith("gen_ai."):
+            modules.add(InsightModules.AGENTS)
+        if op.startswith("mcp."):
+            modules.add(InsightModules.MCP)
+
+        if len(modules) == len(InsightModules):
+            break
+    return modules
+
+
+class StatsPeriod(NamedTuple):
+    segments: int
+    interval: timedelta
 
-StatsPeriod = namedtuple("StatsPeriod", ("segments", "interval"))
 
 LEGACY_RATE_LIMIT_OPTIONS = frozenset(("sentry:project-rate-limit", "sentry:account-rate-limit"))
 
@@ -691,12 +734,23 @@ MAX_SECS_IN_FUTURE = 60
 MAX_SECS_IN_PAST = 2592000  # 30 days
 ALLOWED_FUTURE_DELTA = timedelta(seconds=MAX_SECS_IN_FUTURE)
 
-DEFAULT_STORE_NORMALIZER_ARGS = dict(
-    geoip_lookup=rust_geoip,
-    max_secs_in_future=MAX_SECS_IN_FUTURE,
-    max_secs_in_past=MAX_SECS_IN_PAST,
-    enable_trimming=True,
-)
+# Kept for existing importers, resolved by `__getattr__`.
+DEFAULT_STORE_NORMALIZER_ARGS: dict[str, Any]
+
+
+@functools.cache
+def get_default_store_normalizer_args() -> dict[str, Any]:
+    # Imported here so that importing this module doesn't open the GeoIP
+    # database in processes that never normalize events.
+    from sentry.utils.geo import rust_geoip
+
+    return dict(
+        geoip_lookup=rust_geoip,
+        max_secs_in_future=MAX_SECS_IN_FUTURE,
+        max_secs_in_past=MAX_SECS_IN_PAST,
+        enable_trimming=True,
+    )
+
 
 INTERNAL_INTEGRATION_TOKEN_COUNT_MAX = 20
 
@@ -809,256 +863,260 @@ HEALTH_CHECK_GLOBS = [
 ]
 
 
-NEL_CULPRITS = {
-    # https://w3c.github.io/network-error-logging/#predefined-network-error-types
-    "dns.unreachable": "DNS server is unreachable",
-    "dns.name_not_resolved": "DNS server responded but is unable to resolve the address",
-    "dns.failed": "Request to the DNS server failed due to reasons not covered by previous errors",
-    "dns.address_changed": "Indicates that the resolved IP address for a request's origin has changed since the corresponding NEL policy was received",
-    "tcp.timed_out": "TCP connection to the server timed out",
-    "tcp.closed": "The TCP connection was closed by the server",
-    "tcp.reset": "The TCP connection was reset",
-    "tcp.refused": "The TCP connection was refused by the server",
-    "tcp.aborted": "The TCP connection was aborted",
-    "tcp.address_invalid": "The IP address is invalid",
-    "tcp.address_unreachable": "The IP address is unreachable",
-    "tcp.failed": "The TCP connection failed due to reasons not covered by previous errors",
-    "tls.version_or_cipher_mismatch": "The TLS connection was aborted due to version or cipher mismatch",
-    "tls.bad_client_auth_cert": "The TLS connection was aborted due to invalid client certificate",
-    "tls.cert.name_invalid": "The TLS connection was aborted due to invalid name",
-    "tls.cert.date_invalid": "The TLS connection was aborted due to invalid certificate date",
-    "tls.cert.authority_invalid": "The TLS connection was aborted due to invalid issuing authority",
-    "tls.cert.invalid": "The TLS connection was aborted due to invalid certificate",
-    "tls.cert.revoked": "The TLS connection was aborted due to revoked server certificate",
-    "tls.cert.pinned_key_not_in_cert_chain": "The TLS connection was aborted due to a key pinning error",
-    "tls.protocol.error": "The TLS connection was aborted due to a TLS protocol error",
-    "tls.failed": "The TLS connection failed due to reasons not covered by previous errors",
-    "http.error": "The user agent successfully received a response, but it had a {} status code",
-    "http.protocol.error": "The connection was aborted due to an HTTP protocol error",
-    "http.response.invalid": "Response is empty, has a content-length mismatch, has improper encoding, and/or other conditions that prevent user agent from processing the response",
-    "http.response.redirect_loop": "The request was aborted due to a detected redirect loop",
-    "http.failed": "The connection failed due to errors in HTTP protocol not covered by previous errors",
-    "abandoned": "User aborted the resource fetch before it is complete",
-    "unknown": "error type is unknown",
-    # Chromium-specific errors, not documented in the spec
-    # https://chromium.googlesource.com/chromium/src/+/HEAD/net/network_error_logging/network_error_logging_service.cc
-    "dns.protocol": "ERR_DNS_MALFORMED_RESPONSE",
-    "dns.server": "ERR_DNS_SERVER_FAILED",
-    "tls.unrecognized_name_alert": "ERR_SSL_UNRECOGNIZED_NAME_ALERT",
-    "h2.ping_failed": "ERR_HTTP2_PING_FAILED",
-    "h2.protocol.error": "ERR_HTTP2_PROTOCOL_ERROR",
-    "h3.protocol.error": "ERR_QUIC_PROTOCOL_ERROR",
-    "http.response.invalid.empty": "ERR_EMPTY_RESPONSE",
-    "http.response.invalid.content_length_mismatch": "ERR_CONTENT_LENGTH_MISMATCH",
-    "http.response.invalid.incomplete_chunked_encoding": "ERR_INCOMPLETE_CHUNKED_ENCODING",
-    "http.response.invalid.invalid_chunked_encoding": "ERR_INVALID_CHUNKED_ENCODING",
-    "http.request.range_not_satisfiable": "ERR_REQUEST_RANGE_NOT_SATISFIABLE",
-    "http.response.headers.truncated": "ERR_RESPONSE_HEADERS_TRUNCATED",
-    "http.response.headers.multiple_content_disposition": "ERR_RESPONSE_HEADERS_MULTIPLE_CONTENT_DISPOSITION",
-    "http.response.headers.multiple_content_length": "ERR_RESPONSE_HEADERS_MULTIPLE_CONTENT_LENGTH",
-}
+NEL_CULPRITS: Mapping[str, str] = MappingProxyType(
+    {
+        # https://w3c.github.io/network-error-logging/#predefined-network-error-types
+        "dns.unreachable": "DNS server is unreachable",
+        "dns.name_not_resolved": "DNS server responded but is unable to resolve the address",
+        "dns.failed": "Request to the DNS server failed due to reasons not covered by previous errors",
+        "dns.address_changed": "Indicates that the resolved IP address for a request's origin has changed since the corresponding NEL policy was received",
+        "tcp.timed_out": "TCP connection to the server timed out",
+        "tcp.closed": "The TCP connection was closed by the server",
+        "tcp.reset": "The TCP connection was reset",
+        "tcp.refused": "The TCP connection was refused by the server",
+        "tcp.aborted": "The TCP connection was aborted",
+        "tcp.address_invalid": "The IP address is invalid",
+        "tcp.address_unreachable": "The IP address is unreachable",
+        "tcp.failed": "The TCP connection failed due to reasons not covered by previous errors",
+        "tls.version_or_cipher_mismatch": "The TLS connection was aborted due to version or cipher mismatch",
+        "tls.bad_client_auth_cert": "The TLS connection was aborted due to invalid client certificate",
+        "tls.cert.name_invalid": "The TLS connection was aborted due to invalid name",
+        "tls.cert.date_invalid": "The TLS connection was aborted due to invalid certificate date",
+        "tls.cert.authority_invalid": "The TLS connection was aborted due to invalid issuing authority",
+        "tls.cert.invalid": "The TLS connection was aborted due to invalid certificate",
+        "tls.cert.revoked": "The TLS connection was aborted due to revoked server certificate",
+        "tls.cert.pinned_key_not_in_cert_chain": "The TLS connection was aborted due to a key pinning error",
+        "tls.protocol.error": "The TLS connection was aborted due to a TLS protocol error",
+        "tls.failed": "The TLS connection failed due to reasons not covered by previous errors",
+        "http.error": "The user agent successfully received a response, but it had a {} status code",
+        "http.protocol.error": "The connection was aborted due to an HTTP protocol error",
+        "http.response.invalid": "Response is empty, has a content-length mismatch, has improper encoding, and/or other conditions that prevent user agent from processing the response",
+        "http.response.redirect_loop": "The request was aborted due to a detected redirect loop",
+        "http.failed": "The connection failed due to errors in HTTP protocol not covered by previous errors",
+        "abandoned": "User aborted the resource fetch before it is complete",
+        "unknown": "error type is unknown",
+        # Chromium-specific errors, not documented in the spec
+        # https://chromium.googlesource.com/chromium/src/+/HEAD/net/network_error_logging/network_error_logging_service.cc
+        "dns.protocol": "ERR_DNS_MALFORMED_RESPONSE",
+        "dns.server": "ERR_DNS_SERVER_FAILED",
+        "tls.unrecognized_name_alert": "ERR_SSL_UNRECOGNIZED_NAME_ALERT",
+        "h2.ping_failed": "ERR_HTTP2_PING_FAILED",
+        "h2.protocol.error": "ERR_HTTP2_PROTOCOL_ERROR",
+        "h3.protocol.error": "ERR_QUIC_PROTOCOL_ERROR",
+        "http.response.invalid.empty": "ERR_EMPTY_RESPONSE",
+        "http.response.invalid.content_length_mismatch": "ERR_CONTENT_LENGTH_MISMATCH",
+        "http.response.invalid.incomplete_chunked_encoding": "ERR_INCOMPLETE_CHUNKED_ENCODING",
+        "http.response.invalid.invalid_chunked_encoding": "ERR_INVALID_CHUNKED_ENCODING",
+        "http.request.range_not_satisfiable": "ERR_REQUEST_RANGE_NOT_SATISFIABLE",
+        "http.response.headers.truncated": "ERR_RESPONSE_HEADERS_TRUNCATED",
+        "http.response.headers.multiple_content_disposition": "ERR_RESPONSE_HEADERS_MULTIPLE_CONTENT_DISPOSITION",
+        "http.response.headers.multiple_content_length": "ERR_RESPONSE_HEADERS_MULTIPLE_CONTENT_LENGTH",
+    }
+)
 
 # Generated from https://raw.githubusercontent.com/github-linguist/linguist/master/lib/linguist/languages.yml and our list of platforms/languages
-EXTENSION_LANGUAGE_MAP = {
-    "c": "c",
-    "cats": "c",
-    "h": "objective-c",
-    "idc": "c",
-    "cs": "c#",
-    "cake": "coffeescript",
-    "csx": "c#",
-    "linq": "c#",
-    "cpp": "c++",
-    "c++": "c++",
-    "cc": "c++",
-    "cp": "c++",
-    "cppm": "c++",
-    "cxx": "c++",
-    "h++": "c++",
-    "hh": "c++",
-    "hpp": "c++",
-    "hxx": "c++",
-    "inc": "php",
-    "inl": "c++",
-    "ino": "c++",
-    "ipp": "c++",
-    "ixx": "c++",
-    "re": "c++",
-    "tcc": "c++",
-    "tpp": "c++",
-    "txx": "c++",
-    "chs": "c2hs haskell",
-    "clj": "clojure",
-    "bb": "clojure",
-    "boot": "clojure",
-    "cl2": "clojure",
-    "cljc": "clojure",
-    "cljs": "clojure",
-    "cljs.hl": "clojure",
-    "cljscm": "clojure",
-    "cljx": "clojure",
-    "hic": "clojure",
-    "coffee": "coffeescript",
-    "_coffee": "coffeescript",
-    "cjsx": "coffeescript",
-    "iced": "coffeescript",
-    "cfm": "coldfusion",
-    "cfml": "coldfusion",
-    "cfc": "coldfusion cfc",
-    "cr": "crystal",
-    "dart": "dart",
-    "ex": "elixir",
-    "exs": "elixir",
-    "fs": "f#",
-    "fsi": "f#",
-    "fsx": "f#",
-    "go": "go",
-    "groovy": "groovy",
-    "grt": "groovy",
-    "gtpl": "groovy",
-    "gvy": "groovy",
-    "gsp": "groovy server pages",
-    "hcl": "hcl",
-    "nomad": "hcl",
-    "tf": "hcl",
-    "tfvars": "hcl",
-    "workflow": "hcl",
-    "hs": "haskell",
-    "hs-boot": "haskell",
-    "hsc": "haskell",
-    "java": "java",
-    "jav": "java",
-    "jsh": "java",
-    "jsp": "java server pages",
-    "tag": "java server pages",
-    "js": "javascript",
-    "_js": "javascript",
-    "bones": "javascript",
-    "cjs": "javascript",
-    "es": "javascript",
-    "es6": "javascript",
-    "frag": "javascript",
-    "gs": "javascript",
-    "jake": "javascript",
-    "javascript": "javascript",
-    "jsb": "javascript",
-    "jscad": "javascript",
-    "jsfl": "javascript",
-    "jslib": "javascript",
-    "jsm": "javascript",
-    "jspre": "javascript",
-    "jss": "javascript",
-    "jsx": "javascript",
-    "mjs": "javascript",
-    "njs": "javascript",
-    "pac": "javascript",
-    "sjs": "javascript",
-    "ssjs": "javascript",
-    "xsjs": "javascript",
-    "xsjslib": "javascript",
-    "js.erb": "javascript+erb",
-    "kt": "kotlin",
-    "ktm": "kotlin",
-    "kts": "kotlin",
-    "litcoffee": "literate coffeescript",
-    "coffee.md": "literate coffeescript",
-    "lhs": "literate haskell",
-    "lua": "lua",
-    "fcgi": "ruby",
-    "nse": "lua",
-    "p8": "lua",
-    "pd_lua": "lua",
-    "rbxs": "lua",
-    "rockspec": "lua",
-    "wlua": "lua",
-    "numpy": "numpy",
-    "numpyw": "numpy",
-    "numsc": "numpy",
-    "ml": "ocaml",
-    "eliom": "ocaml",
-    "eliomi": "ocaml",
-    "ml4": "ocaml",
-    "mli": "ocaml",
-    "mll": "ocaml",
-    "mly": "ocaml",
-    "m": "objective-c",
-    "mm": "objective-c++",
-    "cl": "opencl",
-    "opencl": "opencl",
-    "php": "php",
-    "aw": "php",
-    "ctp": "php",
-    "php3": "php",
-    "php4": "php",
-    "php5": "php",
-    "phps": "php",
-    "phpt": "php",
-    "pl": "perl",
-    "al": "perl",
-    "cgi": "python",
-    "perl": "perl",
-    "ph": "perl",
-    "plx": "perl",
-    "pm": "perl",
-    "psgi": "perl",
-    "t": "perl",
-    "ps1": "powershell",
-    "psd1": "powershell",
-    "psm1": "powershell",
-    "py": "python",
-    "gyp": "python",
-    "gypi": "python",
-    "lmi": "python",
-    "py3": "python",
-    "pyde": "python",
-    "pyi": "python",
-    "pyp": "python",
-    "pyt": "python",
-    "pyw": "python",
-    "rpy": "python",
-    "spec": "ruby",
-    "tac": "python",
-    "wsgi": "python",
-    "xpy": "python",
-    "rb": "ruby",
-    "builder": "ruby",
-    "eye": "ruby",
-    "gemspec": "ruby",
-    "god": "ruby",
-    "jbuilder": "ruby",
-    "mspec": "ruby",
-    "pluginspec": "ruby",
-    "podspec": "ruby",
-    "prawn": "ruby",
-    "rabl": "ruby",
-    "rake": "ruby",
-    "rbi": "ruby",
-    "rbuild": "ruby",
-    "rbw": "ruby",
-    "rbx": "ruby",
-    "ru": "ruby",
-    "ruby": "ruby",
-    "thor": "ruby",
-    "watchr": "ruby",
-    "rs": "rust",
-    "rs.in": "rust",
-    "scala": "scala",
-    "kojo": "scala",
-    "sbt": "scala",
-    "sc": "scala",
-    "smk": "snakemake",
-    "snakefile": "snakemake",
-    "swift": "swift",
-    "tsx": "tsx",
-    "ts": "typescript",
-    "cts": "typescript",
-    "mts": "typescript",
-    "upc": "unified parallel c",
-    "vb": "visual basic .net",
-    "vbhtml": "visual basic .net",
-    "bas": "visual basic 6.0",
-    "cls": "visual basic 6.0",
-    "ctl": "visual basic 6.0",
-    "dsr": "visual basic 6.0",
-    "frm": "visual basic 6.0",
-}
+EXTENSION_LANGUAGE_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "c": "c",
+        "cats": "c",
+        "h": "objective-c",
+        "idc": "c",
+        "cs": "c#",
+        "cake": "coffeescript",
+        "csx": "c#",
+        "linq": "c#",
+        "cpp": "c++",
+        "c++": "c++",
+        "cc": "c++",
+        "cp": "c++",
+        "cppm": "c++",
+        "cxx": "c++",
+        "h++": "c++",
+        "hh": "c++",
+        "hpp": "c++",
+        "hxx": "c++",
+        "inc": "php",
+        "inl": "c++",
+        "ino": "c++",
+        "ipp": "c++",
+        "ixx": "c++",
+        "re": "c++",
+        "tcc": "c++",
+        "tpp": "c++",
+        "txx": "c++",
+        "chs": "c2hs haskell",
+        "clj": "clojure",
+        "bb": "clojure",
+        "boot": "clojure",
+        "cl2": "clojure",
+        "cljc": "clojure",
+        "cljs": "clojure",
+        "cljs.hl": "clojure",
+        "cljscm": "clojure",
+        "cljx": "clojure",
+        "hic": "clojure",
+        "coffee": "coffeescript",
+        "_coffee": "coffeescript",
+        "cjsx": "coffeescript",
+        "iced": "coffeescript",
+        "cfm": "coldfusion",
+        "cfml": "coldfusion",
+        "cfc": "coldfusion cfc",
+        "cr": "crystal",
+        "dart": "dart",
+        "ex": "elixir",
+        "exs": "elixir",
+        "fs": "f#",
+        "fsi": "f#",
+        "fsx": "f#",
+        "go": "go",
+        "groovy": "groovy",
+        "grt": "groovy",
+        "gtpl": "groovy",
+        "gvy": "groovy",
+        "gsp": "groovy server pages",
+        "hcl": "hcl",
+        "nomad": "hcl",
+        "tf": "hcl",
+        "tfvars": "hcl",
+        "workflow": "hcl",
+        "hs": "haskell",
+        "hs-boot": "haskell",
+        "hsc": "haskell",
+        "java": "java",
+        "jav": "java",
+        "jsh": "java",
+        "jsp": "java server pages",
+        "tag": "java server pages",
+        "js": "javascript",
+        "_js": "javascript",
+        "bones": "javascript",
+        "cjs": "javascript",
+        "es": "javascript",
+        "es6": "javascript",
+        "frag": "javascript",
+        "gs": "javascript",
+        "jake": "javascript",
+        "javascript": "javascript",
+        "jsb": "javascript",
+        "jscad": "javascript",
+        "jsfl": "javascript",
+        "jslib": "javascript",
+        "jsm": "javascript",
+        "jspre": "javascript",
+        "jss": "javascript",
+        "jsx": "javascript",
+        "mjs": "javascript",
+        "njs": "javascript",
+        "pac": "javascript",
+        "sjs": "javascript",
+        "ssjs": "javascript",
+        "xsjs": "javascript",
+        "xsjslib": "javascript",
+        "js.erb": "javascript+erb",
+        "kt": "kotlin",
+        "ktm": "kotlin",
+        "kts": "kotlin",
+        "litcoffee": "literate coffeescript",
+        "coffee.md": "literate coffeescript",
+        "lhs": "literate haskell",
+        "lua": "lua",
+        "fcgi": "ruby",
+        "nse": "lua",
+        "p8": "lua",
+        "pd_lua": "lua",
+        "rbxs": "lua",
+        "rockspec": "lua",
+        "wlua": "lua",
+        "numpy": "numpy",
+        "numpyw": "numpy",
+        "numsc": "numpy",
+        "ml": "ocaml",
+        "eliom": "ocaml",
+        "eliomi": "ocaml",
+        "ml4": "ocaml",
+        "mli": "ocaml",
+        "mll": "ocaml",
+        "mly": "ocaml",
+        "m": "objective-c",
+        "mm": "objective-c++",
+        "cl": "opencl",
+        "opencl": "opencl",
+        "php": "php",
+        "aw": "php",
+        "ctp": "php",
+        "php3": "php",
+        "php4": "php",
+        "php5": "php",
+        "phps": "php",
+        "phpt": "php",
+        "pl": "perl",
+        "al": "perl",
+        "cgi": "python",
+        "perl": "perl",
+        "ph": "perl",
+        "plx": "perl",
+        "pm": "perl",
+        "psgi": "perl",
+        "t": "perl",
+        "ps1": "powershell",
+        "psd1": "powershell",
+        "psm1": "powershell",
+        "py": "python",
+        "gyp": "python",
+        "gypi": "python",
+        "lmi": "python",
+        "py3": "python",
+        "pyde": "python",
+        "pyi": "python",
+        "pyp": "python",
+        "pyt": "python",
+        "pyw": "python",
+        "rpy": "python",
+        "spec": "ruby",
+        "tac": "python",
+        "wsgi": "python",
+        "xpy": "python",
+        "rb": "ruby",
+        "builder": "ruby",
+        "eye": "ruby",
+        "gemspec": "ruby",
+        "god": "ruby",
+        "jbuilder": "ruby",
+        "mspec": "ruby",
+        "pluginspec": "ruby",
+        "podspec": "ruby",
+        "prawn": "ruby",
+        "rabl": "ruby",
+        "rake": "ruby",
+        "rbi": "ruby",
+        "rbuild": "ruby",
+        "rbw": "ruby",
+        "rbx": "ruby",
+        "ru": "ruby",
+        "ruby": "ruby",
+        "thor": "ruby",
+        "watchr": "ruby",
+        "rs": "rust",
+        "rs.in": "rust",
+        "scala": "scala",
+        "kojo": "scala",
+        "sbt": "scala",
+        "sc": "scala",
+        "smk": "snakemake",
+        "snakefile": "snakemake",
+        "swift": "swift",
+        "tsx": "tsx",
+        "ts": "typescript",
+        "cts": "typescript",
+        "mts": "typescript",
+        "upc": "unified parallel c",
+        "vb": "visual basic .net",
+        "vbhtml": "visual basic .net",
+        "bas": "visual basic 6.0",
+        "cls": "visual basic 6.0",
+        "ctl": "visual basic 6.0",
+        "dsr": "visual basic 6.0",
+        "frm": "visual basic 6.0",
+    }
+)
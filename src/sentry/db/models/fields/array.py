@@ -7,10 +7,10 @@ from __future__ import annotations
 
 import ast
 
+import orjson
 from django.db import models
 
 from sentry.db.models.utils import Creator
-from sentry.utils import json
 
 
 # Adapted from django-pgfields
@@ -54,15 +54,15 @@ class ArrayField(models.Field):
 
         # Appropriately coerce each individual value within
         # our array.
-        return [self.of.get_prep_value(item) for item in value]
+        return list(map(self.of.get_prep_value, value))
 
     def to_python(self, value):
         if not value:
             value = []
         if isinstance(value, str):
             try:
-                value = json.loads(value)
-            except json.JSONDecodeError:
+                value = orjson.loads(value)
+            except orjson.JSONDecodeError:
                 # This is to accommodate the erroneous exports pre 21.4.0
                 # See getsentry/sentry#23843 for more details
                 try:
@@ -73,4 +73,4 @@ class ArrayField(models.Field):
                     assert value[0] == "{" and value[-1] == "}", "Unexpected ArrayField format"
                     assert "\\" not in value, "Unexpected ArrayField format"
                     value = value[1:-1].split(",")
-        return [self.of.to_python(x) for x in value]
+        return list(map(self.of.to_python, value))
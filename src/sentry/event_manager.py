@@ -33,14 +33,14 @@ from sentry import (
 )
 from sentry.attachments import CachedAttachment, MissingAttachmentChunks, attachment_cache
 from sentry.constants import (
-    DEFAULT_STORE_NORMALIZER_ARGS,
-    INSIGHT_MODULE_FILTERS,
     LOG_LEVELS_MAP,
     MAX_TAG_VALUE_LENGTH,
     PLACEHOLDER_EVENT_TITLES,
     VALID_PLATFORMS,
     DataCategory,
     InsightModules,
+    detect_insight_modules,
+    get_default_store_normalizer_args,
 )
 from sentry.culprit import generate_culprit
 from sentry.dynamic_sampling import record_latest_release
@@ -401,7 +401,7 @@ class EventManager:
             normalize_user_agent=True,
             sent_at=self.sent_at.isoformat() if self.sent_at is not None else None,
             json_dumps=orjson.dumps,
-            **DEFAULT_STORE_NORMALIZER_ARGS,
+            **get_default_store_normalizer_args(),
         )
 
         pre_normalize_type = self._data.get("type")
@@ -2624,14 +2624,13 @@ def _record_transaction_info(
                 )
 
             spans = job["data"]["spans"]
-            for module, is_module in INSIGHT_MODULE_FILTERS.items():
-                if is_module(spans):
-                    set_project_flag_and_signal(
-                        project,
-                        INSIGHT_MODULE_TO_PROJECT_FLAG_NAME[module],
-                        first_insight_span_received,
-                        module=module,
-                    )
+            for module in detect_insight_modules(spans):
+                set_project_flag_and_signal(
+                    project,
+                    INSIGHT_MODULE_TO_PROJECT_FLAG_NAME[module],
+                    first_insight_span_received,
+                    module=module,
+                )
 
             if job["release"]:
                 environment = job["data"].get("environment") or None  # coorce "" to None
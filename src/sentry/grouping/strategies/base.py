@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import inspect
-from collections.abc import Callable, Iterator, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Generic, Protocol, Self, TypeVar, overload
 
 from sentry import projectoptions
@@ -96,8 +97,10 @@ def strategy(
 
 class GroupingContext:
     def __init__(self, strategy_config: StrategyConfiguration, event: Event):
-        # The initial context is essentially the grouping config options
-        self._stack = [strategy_config.initial_context]
+        # The initial context is essentially the grouping config options. It's
+        # shared by every event using the config, so it's never written to.
+        self._initial_context = strategy_config.initial_context
+        self._stack: list[ContextDict] = []
         self.config = strategy_config
         self.event = event
         self.push()
@@ -111,7 +114,7 @@ class GroupingContext:
         for d in reversed(self._stack):
             if key in d:
                 return d[key]
-        raise KeyError(key)
+        return self._initial_context[key]
 
     def __enter__(self) -> Self:
         self.push()
@@ -296,11 +299,13 @@ class StrategyConfiguration:
     id: str | None
     base: type[StrategyConfiguration] | None = None
     strategies: dict[str, Strategy[Any]] = {}
+    # `strategies` ordered from highest to lowest score
+    strategies_by_score: tuple[Strategy[Any], ...] = ()
     delegates: dict[str, Strategy[Any]] = {}
     changelog: str | None = None
     hidden = False
     risk = RISK_LEVEL_LOW
-    initial_context: ContextDict = {}
+    initial_context: Mapping[str, ContextValue] = MappingProxyType({})
     enhancements_base: str | None = DEFAULT_ENHANCEMENTS_BASE
     fingerprinting_bases: Sequence[str] | None = DEFAULT_GROUPING_FINGERPRINTING_BASES
 
@@ -327,7 +332,7 @@ class StrategyConfiguration:
 
     def iter_strategies(self) -> Iterator[Strategy[Any]]:
         """Iterates over all strategies by highest score to lowest."""
-        return iter(sorted(self.strategies.values(), key=lambda x: -x.score if x.score else 0))
+        return iter(self.strategies_by_score)
 
     @classmethod
     def as_dict(cls) -> dict[str, Any]:
@@ -375,7 +380,6 @@ def create_strategy_configuration_class(
     NewStrategyConfiguration.base = base
     NewStrategyConfiguration.strategies = dict(base.strategies) if base else {}
     NewStrategyConfiguration.delegates = dict(base.delegates) if base else {}
-    NewStrategyConfiguration.initial_context = dict(base.initial_context) if base else {}
     NewStrategyConfiguration.enhancements_base = base.enhancements_base if base else None
     if base and base.fingerprinting_bases is not None:
         NewStrategyConfiguration.fingerprinting_bases = list(base.fingerprinting_bases)
@@ -399,6 +403,14 @@ def create_strategy_configuration_class(
             NewStrategyConfiguration.strategies.pop(old_id, None)
         NewStrategyConfiguration.strategies[strategy_id] = strategy
 
+    # Sorted once here rather than every time an event is grouped
+    NewStrategyConfiguration.strategies_by_score = tuple(
+        sorted(
+            NewStrategyConfiguration.strategies.values(),
+            key=lambda x: -x.score if x.score else 0,
+        )
+    )
+
     new_delegates = set()
     for strategy_id in delegates or ():
         strategy = lookup_strategy(strategy_id)
@@ -410,8 +422,10 @@ def create_strategy_configuration_class(
         NewStrategyConfiguration.delegates[strategy.interface_name] = strategy
         new_delegates.add(strategy.interface_name)
 
-    if initial_context:
-        NewStrategyConfiguration.initial_context.update(initial_context)
+    # Built once per config and shared read-only by every grouping context using it
+    NewStrategyConfiguration.initial_context = MappingProxyType(
+        {**(base.initial_context if base else {}), **(initial_context or {})}
+    )
 
     if enhancements_base:
         NewStrategyConfiguration.enhancements_base = enhancements_base
@@ -1,11 +1,17 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from sentry.grouping.strategies.base import (
     RISK_LEVEL_HIGH,
     StrategyConfiguration,
     create_strategy_configuration_class,
 )
 
-# The full mapping of all known configurations.
-CONFIGURATIONS: dict[str, type[StrategyConfiguration]] = {}
+_CONFIGURATIONS: dict[str, type[StrategyConfiguration]] = {}
+
+# The full mapping of all known configurations.  This is a read-only view, new
+# configurations are only added through `register_strategy_config`.
+CONFIGURATIONS: Mapping[str, type[StrategyConfiguration]] = MappingProxyType(_CONFIGURATIONS)
 
 # The implied base strategy *every* strategy inherits from if no
 # base is defined.
@@ -65,7 +71,7 @@ def register_strategy_config(id: str, **kwargs) -> type[StrategyConfiguration]:
     else:
         kwargs["base"] = BASE_STRATEGY
     strategy_class = create_strategy_configuration_class(id, **kwargs)
-    CONFIGURATIONS[id] = strategy_class
+    _CONFIGURATIONS[id] = strategy_class
     return strategy_class
 
 
@@ -20,7 +20,7 @@ from sentry import analytics, options
 from sentry.api.api_owners import ApiOwner
 from sentry.api.api_publish_status import ApiPublishStatus
 from sentry.api.base import Endpoint, all_silo_endpoint
-from sentry.constants import EXTENSION_LANGUAGE_MAP, ObjectStatus
+from sentry.constants import ObjectStatus
 from sentry.identity.services.identity.service import identity_service
 from sentry.integrations.base import IntegrationDomain
 from sentry.integrations.pipeline import ensure_integration
@@ -47,6 +47,7 @@ from sentry.seer.autofix.webhooks import handle_github_pr_webhook_for_autofix
 from sentry.shared_integrations.exceptions import ApiError
 from sentry.users.services.user.service import user_service
 from sentry.utils import metrics
+from sentry.utils.language_detect import detect_language
 
 from .integration import GitHubIntegrationProvider
 from .repository import GitHubRepositoryProvider
@@ -59,15 +60,6 @@ def get_github_external_id(event: Mapping[str, Any], host: str | None = None) ->
     return f"{host}:{external_id}" if host else external_id
 
 
-def get_file_language(filename: str) -> str | None:
-    extension = filename.split(".")[-1]
-    language = None
-    if extension != filename:
-        language = EXTENSION_LANGUAGE_MAP.get(extension)
-
-    return language
-
-
 class GitHubWebhook(SCMWebhook, ABC):
     """
     Base class for GitHub webhooks handled in region silos.
@@ -434,7 +426,7 @@ class PushEventWebhook(GitHubWebhook):
                     file_changes = []
 
                     for fname in commit["added"]:
-                        languages.add(get_file_language(fname))
+                        languages.add(detect_language(fname))
                         file_changes.append(
                             CommitFileChange(
                                 organization_id=organization.id,
@@ -445,7 +437,7 @@ class PushEventWebhook(GitHubWebhook):
                         )
 
                     for fname in commit["removed"]:
-                        languages.add(get_file_language(fname))
+                        languages.add(detect_language(fname))
                         file_changes.append(
                             CommitFileChange(
                                 organization_id=organization.id,
@@ -456,7 +448,7 @@ class PushEventWebhook(GitHubWebhook):
                         )
 
                     for fname in commit["modified"]:
-                        languages.add(get_file_language(fname))
+                        languages.add(detect_language(fname))
                         file_changes.append(
                             CommitFileChange(
                                 organization_id=organization.id,
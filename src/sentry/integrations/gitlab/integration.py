@@ -175,16 +175,18 @@ class GitlabIntegration(RepositoryIntegration, GitlabIssuesSpec, CommitContextIn
         return f"{base_url}/{repo_name}/blob/{branch}/{filepath}"
 
     def extract_branch_from_source_url(self, repo: Repository, url: str) -> str:
-        url = url.replace(f"{repo.url}/-/blob/", "")
-        url = url.replace(f"{repo.url}/blob/", "")
-        branch, _, _ = url.partition("/")
-        return branch
+        return self.extract_branch_and_source_path_from_source_url(repo, url)[0]
 
     def extract_source_path_from_source_url(self, repo: Repository, url: str) -> str:
+        return self.extract_branch_and_source_path_from_source_url(repo, url)[1]
+
+    def extract_branch_and_source_path_from_source_url(
+        self, repo: Repository, url: str
+    ) -> tuple[str, str]:
         url = url.replace(f"{repo.url}/-/blob/", "")
         url = url.replace(f"{repo.url}/blob/", "")
-        _, _, source_path = url.partition("/")
-        return source_path
+        branch, _, source_path = url.partition("/")
+        return branch, source_path
 
     # CommitContextIntegration methods
 
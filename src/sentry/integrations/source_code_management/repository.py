@@ -92,6 +92,19 @@ class RepositoryIntegration(IntegrationInstallation, BaseRepositoryIntegration,
         """Extracts the source path from the source code url. Used for stacktrace linking."""
         raise NotImplementedError
 
+    def extract_branch_and_source_path_from_source_url(
+        self, repo: Repository, url: str
+    ) -> tuple[str, str]:
+        """
+        Extracts both the branch and the source path from the source code url. Used for
+        stacktrace linking. Integrations that can get both from a single pass over the
+        url should override this.
+        """
+        return (
+            self.extract_branch_from_source_url(repo, url),
+            self.extract_source_path_from_source_url(repo, url),
+        )
+
     @abstractmethod
     def has_repo_access(self, repo: RpcRepository) -> bool:
         """Used for migrating repositories. Checks if the installation has access to the repository."""
@@ -300,7 +300,7 @@ def open_pr_comment_workflow(pr_id: int) -> None:
         if not len(projects) or not len(sentry_filenames):
             continue
 
-        file_extension = file.filename.split(".")[-1]
+        file_extension = file.filename.rpartition(".")[2]
         logger.info(
             _open_pr_comment_log(integration_name=integration_name, suffix="file_extension"),
             extra={
@@ -470,12 +470,14 @@ def open_pr_comment_workflow(pr_id: int) -> None:
     issue_id_list: list[int] = [issue["group_id"] for issue in issue_list]
 
     # pick one language from the list of languages in the PR for analytics
-    languages = [
-        EXTENSION_LANGUAGE_MAP[extension]
-        for extension in file_extensions
-        if extension in EXTENSION_LANGUAGE_MAP
-    ]
-    language = languages[0] if len(languages) else "not found"
+    language = next(
+        (
+            EXTENSION_LANGUAGE_MAP[extension]
+            for extension in file_extensions
+            if extension in EXTENSION_LANGUAGE_MAP
+        ),
+        "not found",
+    )
 
     comment_data = open_pr_comment_workflow.get_comment_data(comment_body=comment_body)
 
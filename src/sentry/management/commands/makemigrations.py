@@ -1,6 +1,9 @@
 import os
 import sys
+from collections import defaultdict
+from pathlib import Path
 
+from django.apps import AppConfig
 from django.apps.registry import apps
 from django.conf import settings
 from django.core.management.commands import makemigrations
@@ -22,11 +25,10 @@ def validate(migrations_filepath: str, latest_migration_by_app: dict[str, str])
     infile = {}
     with open(migrations_filepath, encoding="utf-8") as file:
         for line in file:
-            try:
-                app_label, name = line.split(": ")
+            app_label, sep, name = line.partition(": ")
+            # skip the header and blank lines
+            if sep:
                 infile[app_label] = name.strip()
-            except ValueError:
-                pass
 
     for app_label, name in sorted(latest_migration_by_app.items()):
         if infile[app_label] != name:
@@ -41,6 +43,14 @@ def _migration_sort_key(name: str) -> tuple[int, bool]:
     return int(name.removeprefix("0001_squashed_")[:4]), name.startswith("0001_squashed_")
 
 
+def _is_in_tree(app_cfg: AppConfig) -> bool:
+    if app_cfg.module is None or app_cfg.module.__file__ is None:
+        raise AssertionError(f"{app_cfg.name} is missing __init__.py")
+
+    rel = os.path.relpath(app_cfg.module.__file__, settings.MIGRATIONS_LOCKFILE_PATH)
+    return "/site-packages/" not in rel and not rel.startswith("../")
+
+
 class Command(makemigrations.Command):
     """
     Generates a lockfile so that Git will detect merge conflicts if there's a migration
@@ -57,22 +67,16 @@ class Command(makemigrations.Command):
         super().handle(*app_labels, **options)
         loader = MigrationLoader(None, ignore_no_migrations=True)
 
-        latest_migration_by_app: dict[str, str] = {}
+        names_by_app: defaultdict[str, list[str]] = defaultdict(list)
         for migration in loader.disk_migrations.values():
-            name = migration.name
-            app_label = migration.app_label
-            app_cfg = apps.get_app_config(app_label)
+            names_by_app[migration.app_label].append(migration.name)
 
-            if app_cfg.module is None or app_cfg.module.__file__ is None:
-                raise AssertionError(f"{app_cfg.name} is missing __init__.py")
-
-            rel = os.path.relpath(app_cfg.module.__file__, settings.MIGRATIONS_LOCKFILE_PATH)
+        latest_migration_by_app: dict[str, str] = {}
+        for app_label, names in names_by_app.items():
             # do not lock migrations from outside the tree
-            if "/site-packages/" in rel or rel.startswith("../"):
+            if not _is_in_tree(apps.get_app_config(app_label)):
                 continue
-            latest_migration_by_app[app_label] = max(
-                latest_migration_by_app.get(app_label, "0"), name, key=_migration_sort_key
-            )
+            latest_migration_by_app[app_label] = max(names, key=_migration_sort_key)
 
         migrations_filepath = os.path.join(
             settings.MIGRATIONS_LOCKFILE_PATH, "migrations_lockfile.txt"
@@ -85,5 +89,5 @@ class Command(makemigrations.Command):
                 for app_label, name in sorted(latest_migration_by_app.items())
             )
 
-            with open(migrations_filepath, "w") as f:
-                f.write(template % result)
+            # read back as utf-8 by `validate`, so don't depend on the locale's encoding
+            Path(migrations_filepath).write_bytes((template % result).encode("utf-8"))
@@ -9,7 +9,8 @@ import orjson
 import sentry_sdk
 from django.contrib.postgres.fields.array import ArrayField
 from django.db import IntegrityError, models, router
-from django.db.models import Case, Exists, F, Func, OuterRef, Sum, When
+from django.db.models import Case, Exists, F, Func, OuterRef, Q, Sum, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -280,6 +281,15 @@ class Release(Model):
             models.Index(fields=("organization", "build_number")),
             models.Index(fields=("organization", "date_added")),
             models.Index(fields=("organization", "status")),
+            # Serves the open release listing, which is ordered by when the
+            # release went out (falling back to when it was created).
+            models.Index(
+                "organization",
+                Coalesce("date_released", "date_added").desc(),
+                F("id").desc(),
+                condition=Q(status=ReleaseStatus.OPEN) | Q(status__isnull=True),
+                name="sentry_release_open_sort_idx",
+            ),
         ]
 
     __repr__ = sane_repr("organization_id", "version")
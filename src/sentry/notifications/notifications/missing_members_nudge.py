@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import Mapping, MutableMapping, Sequence
+from types import MappingProxyType
 from typing import Any
 
 from sentry.db.models.base import Model
@@ -13,7 +14,11 @@ from sentry.notifications.notifications.strategies.member_write_role_recipient_s
 from sentry.notifications.types import NotificationSettingEnum
 from sentry.types.actor import Actor
 
-PROVIDER_TO_URL = {IntegrationProviderSlug.GITHUB.value: "https://github.com/"}
+PROVIDER_TO_URL: Mapping[str, str] = MappingProxyType(
+    {IntegrationProviderSlug.GITHUB.value: "https://github.com/"}
+)
+
+_EMAIL_ONLY: tuple[ExternalProviders, ...] = (ExternalProviders.EMAIL,)
 
 
 class MissingMembersNudgeNotification(BaseNotification):
@@ -31,9 +36,18 @@ class MissingMembersNudgeNotification(BaseNotification):
         provider: str,
     ) -> None:
         super().__init__(organization)
+        profile_url = PROVIDER_TO_URL[provider]
+        # copy the authors rather than adding the link to the caller's dicts, and
+        # only list each author once even if they were passed in more than once
+        authors_by_external_id: dict[str, dict[str, Any]] = {}
         for author in commit_authors:
-            author["profile_link"] = PROVIDER_TO_URL[provider] + author["external_id"]
-        self.commit_authors = commit_authors
+            external_id = author["external_id"]
+            if external_id not in authors_by_external_id:
+                authors_by_external_id[external_id] = {
+                    **author,
+                    "profile_link": profile_url + external_id,
+                }
+        self.commit_authors = list(authors_by_external_id.values())
         self.provider = provider
         self.role_based_recipient_strategy = self.RoleBasedRecipientStrategyClass(organization)
 
@@ -44,9 +58,9 @@ class MissingMembersNudgeNotification(BaseNotification):
     def get_subject(self, context: Mapping[str, Any] | None = None) -> str:
         return "Invite your developers to Sentry"
 
-    def get_notification_providers(self) -> Iterable[ExternalProviders]:
+    def get_notification_providers(self) -> Sequence[ExternalProviders]:
         # only email
-        return [ExternalProviders.EMAIL]
+        return _EMAIL_ONLY
 
     def get_members_list_url(
         self, provider: ExternalProviders, recipient: Actor | None = None
@@ -67,5 +81,8 @@ class MissingMembersNudgeNotification(BaseNotification):
         }
 
     def determine_recipients(self) -> list[Actor]:
+        # nobody to invite, so there is nothing to send
+        if not self.commit_authors:
+            return []
         # owners and managers have org:write
         return Actor.many_from_object(self.role_based_recipient_strategy.determine_recipients())
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
     from sentry.utils.cursors import Cursor, CursorResult
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuleGroupHistory:
     group: Group
     count: int
@@ -23,7 +23,7 @@ class RuleGroupHistory:
     event_id: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeSeriesValue:
     bucket: datetime
     count: int
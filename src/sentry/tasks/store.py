@@ -13,7 +13,7 @@ from sentry_relay.processing import StoreNormalizer
 
 from sentry import options, reprocessing2
 from sentry.attachments import attachment_cache
-from sentry.constants import DEFAULT_STORE_NORMALIZER_ARGS
+from sentry.constants import get_default_store_normalizer_args
 from sentry.datascrubbing import scrub_data
 from sentry.eventstore import processing
 from sentry.feedback.usecases.ingest.save_event_feedback import (
@@ -292,7 +292,7 @@ def normalize_event(data: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
         remove_other=False,
         is_renormalize=True,
         json_dumps=orjson.dumps,
-        **DEFAULT_STORE_NORMALIZER_ARGS,
+        **get_default_store_normalizer_args(),
     )
     return normalizer.normalize_event(dict(data), json_loads=orjson.loads)
 
@@ -0,0 +1,23 @@
+from sentry.constants import EXTENSION_LANGUAGE_MAP
+
+
+def detect_language(filename: str) -> str | None:
+    """
+    Returns the language of a file based on its extension, or None if it isn't
+    known. Compound extensions such as ``coffee.md`` or ``js.erb`` take
+    precedence over the last extension alone.
+    """
+    # Extensions in the map are lowercase, as generated from linguist.
+    basename = filename.rpartition("/")[2].lower()
+    rest, sep, extension = basename.rpartition(".")
+    if not sep:
+        return None
+
+    # The longest extensions in the map have two components.
+    _, sep, second_extension = rest.rpartition(".")
+    if sep:
+        language = EXTENSION_LANGUAGE_MAP.get(f"{second_extension}.{extension}")
+        if language is not None:
+            return language
+
+    return EXTENSION_LANGUAGE_MAP.get(extension)
@@ -7,7 +7,7 @@ from uuid import uuid4
 
 from django.core.exceptions import SuspiciousFileOperation
 
-from sentry.constants import DATA_ROOT, INTEGRATION_ID_TO_PLATFORM_DATA
+from sentry.constants import DATA_ROOT
 from sentry.event_manager import EventManager, set_tag
 from sentry.interfaces.user import User as UserInterface
 from sentry.spans.grouping.utils import hash_values
@@ -123,6 +123,10 @@ def load_data(
     #     event so it's not an empty project.
     #   * When a user clicks Test Configuration from notification plugin settings page,
     #     a fake event is generated to go through the pipeline.
+
+    # Imported here so that importing this module doesn't load the platform data.
+    from sentry.constants import INTEGRATION_ID_TO_PLATFORM_DATA
+
     data = None
     language = None
     platform_data = INTEGRATION_ID_TO_PLATFORM_DATA.get(platform)
@@ -159,11 +163,8 @@ def load_data(
         if not os.path.isfile(json_path):
             raise IsADirectoryError("expected file but found a directory instead")
 
-        if not sample_name:
-            try:
-                sample_name = INTEGRATION_ID_TO_PLATFORM_DATA[platform]["name"]
-            except KeyError:
-                pass
+        if not sample_name and platform_data is not None:
+            sample_name = platform_data.get("name")
 
         # XXX: At this point, it's assumed that `json_path` was safely found
         # within `samples_root` due to the checks above and cannot traverse
@@ -121,6 +121,72 @@ class ProjectReleaseListTest(APITestCase):
         assert response.status_code == 200, response.content
         assert len(response.data) == 1
 
+    def test_pagination(self):
+        self.login_as(user=self.user)
+
+        project = self.create_project(name="foo")
+        releases = []
+        for day in range(1, 4):
+            release = Release.objects.create(
+                organization_id=project.organization_id,
+                version=str(day),
+                date_added=datetime(2013, 8, day, 3, 8, 24, 880386, tzinfo=UTC),
+            )
+            release.add_project(project)
+            releases.append(release)
+
+        url = reverse(
+            "sentry-api-0-project-releases",
+            kwargs={
+                "organization_id_or_slug": project.organization.slug,
+                "project_id_or_slug": project.slug,
+            },
+        )
+        response = self.client.get(url + "?per_page=2", format="json")
+
+        assert response.status_code == 200, response.content
+        assert [r["version"] for r in response.data] == ["3", "2"]
+
+        next_cursor = self.get_cursor_headers(response)[1]
+        response = self.client.get(url + f"?per_page=2&cursor={next_cursor}", format="json")
+
+        assert response.status_code == 200, response.content
+        assert [r["version"] for r in response.data] == ["1"]
+
+    def test_pagination_shared_date(self):
+        self.login_as(user=self.user)
+
+        project = self.create_project(name="foo")
+        date_added = datetime(2013, 8, 13, 3, 8, 24, 880386, tzinfo=UTC)
+        releases = []
+        for version in range(5):
+            release = Release.objects.create(
+                organization_id=project.organization_id,
+                version=str(version),
+                date_added=date_added,
+            )
+            release.add_project(project)
+            releases.append(release)
+
+        url = reverse(
+            "sentry-api-0-project-releases",
+            kwargs={
+                "organization_id_or_slug": project.organization.slug,
+                "project_id_or_slug": project.slug,
+            },
+        )
+        versions = []
+        cursor = None
+        for _ in range(3):
+            query = "?per_page=2" + (f"&cursor={cursor}" if cursor else "")
+            response = self.client.get(url + query, format="json")
+            assert response.status_code == 200, response.content
+            versions.extend(r["version"] for r in response.data)
+            cursor = self.get_cursor_headers(response)[1]
+
+        # Releases sharing a date are ordered by id, and each shows up once.
+        assert versions == [r.version for r in reversed(releases)]
+
 
 class ProjectReleaseListEnvironmentsTest(APITestCase):
     def setUp(self):
@@ -393,6 +459,29 @@ class ProjectReleaseCreateTest(APITestCase):
 
         assert response.status_code == 208, response.content
 
+    def test_duplicate_sets_has_releases(self):
+        self.login_as(user=self.user)
+
+        project = self.create_project(name="foo")
+
+        release = Release.objects.create(version="1.2.1", organization_id=project.organization_id)
+        ReleaseProject.objects.create(project=project, release=release)
+        assert not project.flags.has_releases
+
+        url = reverse(
+            "sentry-api-0-project-releases",
+            kwargs={
+                "organization_id_or_slug": project.organization.slug,
+                "project_id_or_slug": project.slug,
+            },
+        )
+
+        response = self.client.post(url, data={"version": "1.2.1"})
+
+        assert response.status_code == 208, response.content
+        project.refresh_from_db()
+        assert project.flags.has_releases
+
     def test_duplicate_across_org(self):
         self.login_as(user=self.user)
 
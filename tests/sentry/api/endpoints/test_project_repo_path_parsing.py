@@ -80,6 +80,8 @@ class PathMappingSerializerTest(TestCase):
         )
 
         assert serializer.is_valid()
+        assert serializer.installation is not None
+        assert serializer.installation.model.id == self.integration.id
         assert serializer.data["stack_path"] == "/random.py"
         assert serializer.data["source_url"] == "https://github.com/getsentry/sentry/blob/random.py"
 
@@ -110,6 +112,15 @@ class PathMappingSerializerTest(TestCase):
             == "Source code URL points to a different file than the stack trace"
         )
 
+    def test_missing_stack_path(self) -> None:
+        serializer = PathMappingSerializer(
+            context={"organization_id": self.organization.id},
+            data={"source_url": "https://github.com/getsentry/sentry/blob/random.py"},
+        )
+
+        assert not serializer.is_valid()
+        assert serializer.errors["stackPath"][0] == "This field is required."
+
     def test_no_integration(self) -> None:
         new_org = self.create_organization()
         serializer = PathMappingSerializer(
@@ -143,6 +154,35 @@ class PathMappingSerializerTest(TestCase):
         assert not serializer.is_valid()
         assert serializer.errors["sourceUrl"][0] == "Could not find repo"
 
+    def test_repo_on_other_integration(self) -> None:
+        other_integration, _ = self.create_provider_integration_for(
+            self.organization,
+            self.user,
+            provider="github",
+            name="getsentry-other",
+            external_id="5678",
+            metadata={"domain_name": "github.com/getsentry"},
+        )
+        other_repo = self.create_repo(
+            project=self.project,
+            name="getsentry/relay",
+            provider="integrations:github",
+            integration_id=other_integration.id,
+            url="https://github.com/getsentry/relay",
+        )
+        serializer = PathMappingSerializer(
+            context={"organization_id": self.organization.id},
+            data={
+                "source_url": "https://github.com/getsentry/relay/blob/main.rs",
+                "stack_path": "/main.rs",
+            },
+        )
+
+        assert serializer.is_valid()
+        assert serializer.integration is not None
+        assert serializer.integration.id == other_integration.id
+        assert serializer.repo == other_repo
+
 
 class ProjectStacktraceLinkGithubTest(BaseStacktraceLinkTest):
     def setUp(self) -> None:
@@ -180,6 +220,17 @@ class ProjectStacktraceLinkGithubTest(BaseStacktraceLinkTest):
         assert resp.status_code == 400, resp.content
         assert resp.data == {"sourceUrl": ["Enter a valid URL."]}
 
+    def test_malformed_source_url(self) -> None:
+        stack_path = "sentry/api/endpoints/project_stacktrace_link.py"
+        for source_url in (
+            "https://git hub.com/getsentry/sentry/blob/master/project_stacktrace_link.py",
+            "https://github.com/getsentry/sentry/blob/master/\tproject_stacktrace_link.py",
+            "http://:@/project_stacktrace_link.py",
+        ):
+            resp = self.make_post(source_url, stack_path)
+            assert resp.status_code == 400, resp.content
+            assert resp.data == {"sourceUrl": ["Enter a valid URL."]}
+
     def test_wrong_file(self) -> None:
         source_url = "https://github.com/getsentry/sentry/blob/master/src/sentry/api/endpoints/project_releases.py"
         stack_path = "sentry/api/endpoints/project_stacktrace_link.py"
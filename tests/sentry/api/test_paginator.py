@@ -24,6 +24,7 @@ from sentry.api.paginator import (
     ChainPaginator,
     CombinedQuerysetIntermediary,
     CombinedQuerysetPaginator,
+    DateTimeIdPaginator,
     DateTimePaginator,
     GenericOffsetPaginator,
     OffsetPaginator,
@@ -37,7 +38,7 @@ from sentry.models.rule import Rule
 from sentry.testutils.cases import APITestCase, SnubaTestCase, TestCase
 from sentry.testutils.silo import control_silo_test
 from sentry.users.models.user import User
-from sentry.utils.cursors import Cursor
+from sentry.utils.cursors import Cursor, StringCursor
 from sentry.utils.snuba import raw_snql_query
 
 
@@ -382,6 +383,50 @@ class DateTimePaginatorTest(TestCase):
         assert result7[0] == res4
 
 
+class DateTimeIdPaginatorTest(TestCase):
+    def test_shared_timestamp(self):
+        joined = timezone.now()
+        users = [
+            self.create_user(f"{name}@example.com", date_joined=joined)
+            for name in ("foo", "bar", "baz", "qux")
+        ]
+        older = self.create_user("quux@example.com", date_joined=joined - timedelta(seconds=1))
+        expected = [*reversed(users), older]
+
+        paginator = DateTimeIdPaginator(User.objects.all(), "-date_joined")
+        result1 = paginator.get_result(limit=2, cursor=None)
+        assert list(result1) == expected[:2]
+        assert result1.next
+        assert not result1.prev
+
+        result2 = paginator.get_result(limit=2, cursor=result1.next)
+        assert list(result2) == expected[2:4]
+        assert result2.next
+        assert result2.prev
+
+        result3 = paginator.get_result(limit=2, cursor=result2.next)
+        assert list(result3) == expected[4:]
+        assert not result3.next
+        assert result3.prev
+
+        result4 = paginator.get_result(limit=2, cursor=result3.prev)
+        assert list(result4) == expected[2:4]
+        assert result4.prev
+
+    def test_cursor_round_trip(self):
+        user = self.create_user("foo@example.com")
+        paginator = DateTimeIdPaginator(User.objects.all(), "-date_joined")
+
+        key = paginator.get_item_key(user)
+        assert paginator.value_from_cursor(StringCursor.from_string(f"{key}:0:0")) == (
+            user.date_joined,
+            user.id,
+        )
+        assert paginator.value_from_cursor(StringCursor.from_string("0:0:0")) is None
+        with pytest.raises(BadPaginationError):
+            paginator.value_from_cursor(StringCursor.from_string("foo:0:0"))
+
+
 def test_reverse_bisect_left():
     assert reverse_bisect_left([], 0) == 0
 
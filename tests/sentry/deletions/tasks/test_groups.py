@@ -56,8 +56,9 @@ class DeleteGroupTest(TestCase):
         GroupMeta.objects.create(group=group, key="foo", value="bar")
         GroupRedirect.objects.create(group_id=group.id, previous_group_id=1)
 
-        assert nodestore.backend.get(node_id)
-        assert nodestore.backend.get(node_id_2)
+        node_ids = [node_id, node_id_2]
+        nodes = nodestore.backend.get_multi(node_ids)
+        assert all(nodes.get(id) for id in node_ids)
 
         with self.tasks():
             delete_groups(object_ids=[group.id])
@@ -66,8 +67,8 @@ class DeleteGroupTest(TestCase):
         assert not GroupHash.objects.filter(group_id=group.id).exists()
         assert not GroupHashMetadata.objects.filter(grouphash_id=grouphash.id).exists()
         assert not Group.objects.filter(id=group.id).exists()
-        assert not nodestore.backend.get(node_id)
-        assert not nodestore.backend.get(node_id_2)
+        nodes = nodestore.backend.get_multi(node_ids)
+        assert not any(nodes.get(id) for id in node_ids)
 
     def test_first_group_not_found(self) -> None:
         group = self.create_group()
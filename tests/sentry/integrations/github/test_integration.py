@@ -1212,6 +1212,27 @@ class GitHubIntegrationTest(IntegrationTestCase):
             == "src/sentry/integrations/github/integration.py"
         )
 
+    def test_extract_branch_and_source_path_from_source_url(self):
+        installation = self.get_installation_helper()
+        integration = Integration.objects.get(provider=self.provider.key)
+
+        with assume_test_silo_mode(SiloMode.REGION):
+            repo = Repository.objects.create(
+                organization_id=self.organization.id,
+                name="Test-Organization/repo",
+                url="https://github.com/Test-Organization/repo",
+                provider="integrations:github",
+                external_id=123,
+                config={"name": "Test-Organization/repo"},
+                integration_id=integration.id,
+            )
+        source_url = "https://github.com/Test-Organization/repo/blob/master/src/sentry/integrations/github/integration.py"
+
+        assert installation.extract_branch_and_source_path_from_source_url(repo, source_url) == (
+            "master",
+            "src/sentry/integrations/github/integration.py",
+        )
+
     @responses.activate
     def test_get_stacktrace_link_with_special_chars(self):
         """Test that URLs with special characters (like square brackets) are properly encoded"""
@@ -5,7 +5,7 @@ from typing import Any
 import responses
 from sentry_relay.processing import StoreNormalizer
 
-from sentry.constants import DEFAULT_STORE_NORMALIZER_ARGS
+from sentry.constants import get_default_store_normalizer_args
 from sentry.lang.javascript.errormapping import REACT_MAPPING_URL, rewrite_exception
 
 
@@ -294,7 +294,7 @@ class ErrorMappingTest(unittest.TestCase):
 
         # run data through normalization to ensure that the meta is set properly
         normalizer = StoreNormalizer(
-            remove_other=False, is_renormalize=True, **DEFAULT_STORE_NORMALIZER_ARGS
+            remove_other=False, is_renormalize=True, **get_default_store_normalizer_args()
         )
         data = normalizer.normalize_event(dict(data))
 
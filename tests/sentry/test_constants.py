@@ -1,7 +1,11 @@
 from unittest import mock
 
+from sentry._language_manifest import AVAILABLE_LANGUAGES
 from sentry.constants import (
     INTEGRATION_ID_TO_PLATFORM_DATA,
+    InsightModules,
+    detect_insight_modules,
+    get_all_languages,
     get_integration_id_for_event,
     get_integration_id_for_marketing_slug,
 )
@@ -42,3 +46,30 @@ def test_integration_id_for_event():
         assert get_integration_id_for_event("foobar", "sentry-java", []) == "java"
         assert get_integration_id_for_event("java", "foobar", []) == "java"
         assert get_integration_id_for_event("foobar", "foobar", []) is None
+
+
+def test_platform_data_is_loaded_once():
+    from sentry import constants
+
+    assert constants.INTEGRATION_ID_TO_PLATFORM_DATA is constants._get_platform_data()
+
+
+def test_language_manifest_is_up_to_date():
+    # Run `bin/build-language-manifest` after adding or removing a locale.
+    assert AVAILABLE_LANGUAGES == tuple(sorted(get_all_languages()))
+
+
+def test_detect_insight_modules():
+    spans = [
+        {"op": "http.client", "sentry_tags": {"category": "http"}},
+        {"op": "db", "sentry_tags": {"category": "db"}},
+        {"op": "resource.css", "sentry_tags": {"transaction.op": "pageload"}},
+        {"op": "gen_ai.chat"},
+    ]
+    assert detect_insight_modules(spans) == {
+        InsightModules.HTTP,
+        InsightModules.ASSETS,
+        InsightModules.VITAL,
+        InsightModules.AGENTS,
+    }
+    assert detect_insight_modules([]) == set()
@@ -0,0 +1,17 @@
+from sentry.utils.language_detect import detect_language
+
+
+def test_detect_language():
+    assert detect_language("src/app.py") == "python"
+    assert detect_language("app/views/index.js.erb") == "javascript+erb"
+    assert detect_language("README.coffee.md") == "literate coffeescript"
+    assert detect_language("lib/module.min.js") == "javascript"
+    assert detect_language(".py") == "python"
+    assert detect_language("src/Main.JAVA") == "java"
+
+
+def test_detect_language_unknown():
+    assert detect_language("Makefile") is None
+    assert detect_language("some.dir/Makefile") is None
+    assert detect_language("notes.txt") is None
+    assert detect_language("trailing.") is None
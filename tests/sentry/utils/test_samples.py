@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 from django.core.exceptions import SuspiciousFileOperation
 
@@ -45,3 +48,18 @@ def test_sample_as_directory_raises_exception(monkeypatch, tmp_path):
 
     (msg,) = excinfo.value.args
     assert msg == "expected file but found a directory instead"
+
+
+def test_import_does_not_load_platform_data():
+    # Checked in a fresh interpreter, since other tests may have loaded it in this one.
+    prog = """\
+from sentry.runner import configure
+
+configure()
+
+import sentry.utils.samples
+from sentry import constants
+
+assert constants._platform_data_cache is None
+"""
+    subprocess.check_call((sys.executable, "-c", prog))